@@ -1,55 +1,164 @@
+# criticality_calculator.py — one-group k-effective estimate with a neutron cycle diagram
+
+import os
 import streamlit as st
-import numpy as np
-import math
-import graphviz
-
-st.subheader("⚛️ Criticality Calculator")
-
-st.markdown("""
-This tool estimates the **effective neutron multiplication factor** ($k_{eff}$) in a nuclear reactor core using:
-
-$$ k_{eff} = \\frac{\\nu \\cdot \\Sigma_f}{\\Sigma_f + \\Sigma_a} $$
-
-Where:  
-- $\\nu$ = average neutrons per fission  
-- $\\Sigma_f$ = macroscopic fission cross-section  
-- $\\Sigma_a$ = macroscopic absorption cross-section  
-""")
-
-# Inputs
-nu = st.slider("Average neutrons per fission (ν)", 1.5, 3.5, 2.43, step=0.01)
-sigma_f = st.number_input("Macroscopic fission cross-section (Σf, cm⁻¹)", value=0.12)
-sigma_a = st.number_input("Macroscopic absorption cross-section (Σa, cm⁻¹)", value=0.20)
-
-# Calculation
-try:
-    k_eff = (nu * sigma_f) / (sigma_f + sigma_a)
-    k_eff_display = round(k_eff, 4)
-
-    if k_eff < 1:
-        status = "🔵 Subcritical"
-        color = "blue"
-    elif k_eff == 1:
-        status = "🟢 Critical"
-        color = "green"
-    else:
-        status = "🔴 Supercritical"
-        color = "red"
-
-    st.markdown(f"### k-effective: `{k_eff_display}` → **{status}**")
-
-    # Neutron cycle graph
-    g = graphviz.Digraph()
-    g.attr(rankdir="LR", size="6")
-    g.node("Fission", f"Fission Neutrons\nν = {nu}", shape="box", style="filled", fillcolor="#f9f9f9")
-    g.node("Absorption", f"Absorption\nΣa = {sigma_a}", fillcolor="#fdd", style="filled")
-    g.node("Fission2", f"Fission Events\nΣf = {sigma_f}", fillcolor="#dfd", style="filled")
-
-    g.edge("Fission", "Absorption", label="Losses", color="gray")
-    g.edge("Fission", "Fission2", label="Induced Fission", color="orange")
-    g.edge("Fission2", "Fission", label=f"k = {k_eff_display}", color=color)
-
-    st.graphviz_chart(g)
-
-except ZeroDivisionError:
-    st.error("Invalid input: division by zero.")
+from graph_export.diagram_cache import show_diagram
+
+
+def criticality_calculator():
+    import graphviz
+
+    st.subheader("⚛️ Criticality Calculator")
+
+    st.markdown("""
+    This tool estimates the **effective neutron multiplication factor** ($k_{eff}$) in a nuclear reactor core using:
+
+    $$ k_{eff} = \\frac{\\nu \\cdot \\Sigma_f}{\\Sigma_f + \\Sigma_a} $$
+
+    Where:  
+    - $\\nu$ = average neutrons per fission  
+    - $\\Sigma_f$ = macroscopic fission cross-section  
+    - $\\Sigma_a$ = macroscopic absorption cross-section  
+    """)
+
+    # Inputs
+    nu = st.slider("Average neutrons per fission (ν)", 1.5, 3.5, 2.43, step=0.01)
+    sigma_f = st.number_input("Macroscopic fission cross-section (Σf, cm⁻¹)", value=0.12)
+    sigma_a = st.number_input("Macroscopic absorption cross-section (Σa, cm⁻¹)", value=0.20)
+
+    # Calculation
+    try:
+        k_eff = (nu * sigma_f) / (sigma_f + sigma_a)
+        k_eff_display = round(k_eff, 4)
+
+        if k_eff < 1:
+            status = "🔵 Subcritical"
+            color = "blue"
+        elif k_eff == 1:
+            status = "🟢 Critical"
+            color = "green"
+        else:
+            status = "🔴 Supercritical"
+            color = "red"
+
+        st.markdown(f"### k-effective: `{k_eff_display}` → **{status}**")
+
+        # Neutron cycle graph
+        g = graphviz.Digraph()
+        g.attr(rankdir="LR", size="6")
+        g.node("Fission", f"Fission Neutrons\nν = {nu}", shape="box", style="filled", fillcolor="#f9f9f9")
+        g.node("Absorption", f"Absorption\nΣa = {sigma_a}", fillcolor="#fdd", style="filled")
+        g.node("Fission2", f"Fission Events\nΣf = {sigma_f}", fillcolor="#dfd", style="filled")
+
+        g.edge("Fission", "Absorption", label="Losses", color="gray")
+        g.edge("Fission", "Fission2", label="Induced Fission", color="orange")
+        g.edge("Fission2", "Fission", label=f"k = {k_eff_display}", color=color)
+
+        show_diagram(g)
+
+    except ZeroDivisionError:
+        st.error("Invalid input: division by zero.")
+
+    with st.expander("🗺️ Parameter Sweep & Critical Boundary"):
+        _parameter_sweep(nu, sigma_f, sigma_a)
+
+    # Finite geometry: leakage is no longer neglected
+    with st.expander("🎲 Monte Carlo mode (finite geometry)"):
+        geometry_choice = st.selectbox("Geometry", ["Bare sphere", "Reflected sphere", "Slab",
+                                                     "Reactor designer grid"])
+        if geometry_choice == "Reactor designer grid":
+            st.caption("The Reactor Core Designer's enrichment zones and rod lattice, with one-group constants "
+                       "collapsed from its two-group diffusion data; ν, Σf and Σa above are not used.")
+            col1, col2 = st.columns(2)
+            grid_size = col1.slider("Grid Size (NxN)", 5, 100, 15)
+            base_enrichment = col2.slider("Base Enrichment (%)", 1.5, 5.0, 3.0, 0.1)
+            gradient = col1.slider("Enrichment Gradient", 0.0, 1.5, 0.4, 0.01)
+            core_width = col2.slider("Core Width (cm)", 50, 500, 340, 10)
+            rod_spacing = st.slider("Rod Spacing", 2, max(6, grid_size // 10), 3) \
+                if st.checkbox("Insert Control Rods") else None
+        else:
+            size = st.number_input("Radius or slab half-thickness (cm)", min_value=0.1, value=30.0)
+            sigma_s = st.number_input("Macroscopic scattering cross-section (Σs, cm⁻¹)", min_value=0.0,
+                                      value=0.30)
+            reflector = st.number_input("Water reflector thickness (cm)", min_value=0.1, value=10.0) \
+                if geometry_choice == "Reflected sphere" else 0.0
+        particles = st.select_slider("Particles per generation", [2000, 5000, 10000, 20000, 50000], 10000)
+
+        if st.button("Run Monte Carlo"):
+            from decay_math.criticality_mc import designer_grid, material, slab, solve_k, sphere, water
+
+            if geometry_choice == "Reactor designer grid":
+                from reactor_diagram.core_model import build_core
+
+                model = build_core(grid_size, base_enrichment, gradient, 1.0, rod_spacing)
+                geometry = designer_grid(model["core"].clip(0), model["rods"], core_width / grid_size)
+            else:
+                fuel = material(nu, sigma_f, sigma_a, sigma_s)
+                if geometry_choice == "Slab":
+                    geometry = slab([size], [fuel])
+                elif geometry_choice == "Reflected sphere":
+                    geometry = sphere([size, size + reflector], [fuel, water])
+                else:
+                    geometry = sphere([size], [fuel])
+
+            try:
+                with st.spinner("Tracking neutron histories..."):
+                    result = solve_k(geometry, particles=particles, workers=os.cpu_count())
+                st.markdown(f"### Monte Carlo k-effective: `{result['k_eff']:.5f} ± {result['std']:.5f}`")
+                st.caption(f"{result['generations']} generations of {result['particles']:,} neutrons; "
+                           f"± is one standard deviation ({result['std'] * 1e5:.0f} pcm)")
+                st.line_chart({"k per active generation": result["k_generations"]})
+            except (ValueError, RuntimeError) as e:
+                st.error(f"Monte Carlo run failed: {e}")
+
+
+def _parameter_sweep(nu, sigma_f, sigma_a):
+    st.markdown("k-effective over a whole ν × Σf × Σa box, with the k = 1 boundary extracted from the grid. "
+                "Grids are cached by range, so revisiting a box is instant.")
+    nu_range = st.slider("ν range", 1.0, 4.0, (1.5, 3.5), step=0.05)
+    sigma_f_range = st.slider("Σf range (cm⁻¹)", 0.001, 1.0, (0.01, 0.3), step=0.001)
+    sigma_a_range = st.slider("Σa range (cm⁻¹)", 0.001, 2.0, (0.01, 0.5), step=0.001)
+    points = st.slider("Points per axis", 20, 300, 215)
+    # Expander bodies run even when collapsed, so the sweep waits to be switched on
+    if not st.checkbox("Run sweep"):
+        return
+    import time
+    import numpy as np
+    from matplotlib.colors import TwoSlopeNorm
+    from matplotlib.figure import Figure
+    from decay_math.criticality_sweep import criticality_sweep, parameter_labels
+
+    start = time.perf_counter()
+    result = criticality_sweep((*nu_range, points), (*sigma_f_range, points), (*sigma_a_range, points))
+    elapsed = time.perf_counter() - start
+    axes, k = result["axes"], result["k"]
+    st.caption(f"{k.size:,} evaluations in {elapsed * 1000:.0f} ms; "
+               f"{result['supercritical_fraction']:.1%} of the box is supercritical "
+               f"(k from {result['k_min']:.3f} to {result['k_max']:.3f})")
+
+    # Margin of the current design: the Σa at which it would turn critical
+    row = int(np.abs(axes["nu"] - nu).argmin())
+    critical = np.interp(sigma_f, axes["sigma_f"], result["critical_sigma_a"][row], left=np.nan, right=np.nan)
+    if np.isfinite(critical):
+        st.metric("Σa margin to critical (cm⁻¹)", f"{critical - sigma_a:+.4f}",
+                  help=f"k = 1 at Σa = {critical:.4f} cm⁻¹ for ν = {axes['nu'][row]:.2f}, Σf = {sigma_f}")
+
+    fig = Figure(figsize=(10, 4.2))
+    left, right = fig.subplots(1, 2)
+    norm = TwoSlopeNorm(vcenter=1.0, vmin=min(result["k_min"], 0.99), vmax=max(result["k_max"], 1.01))
+    mesh = left.pcolormesh(axes["sigma_a"], axes["sigma_f"], k[row], shading="auto", cmap="coolwarm", norm=norm)
+    left.contour(axes["sigma_a"], axes["sigma_f"], k[row], levels=[1.0], colors="black", linewidths=1.5)
+    left.plot(sigma_a, sigma_f, marker="*", color="gold", markersize=12, markeredgecolor="black")
+    left.set_xlabel(parameter_labels["sigma_a"])
+    left.set_ylabel(parameter_labels["sigma_f"])
+    left.set_title(f"k-effective at ν = {axes['nu'][row]:.2f}")
+    fig.colorbar(mesh, ax=left, label="k-effective")
+
+    surface = right.pcolormesh(axes["sigma_f"], axes["nu"], result["critical_sigma_a"], shading="auto",
+                               cmap="viridis")
+    right.set_xlabel(parameter_labels["sigma_f"])
+    right.set_ylabel(parameter_labels["nu"])
+    right.set_title("Critical Σa (k = 1 surface)")
+    fig.colorbar(surface, ax=right, label=parameter_labels["sigma_a"])
+    fig.tight_layout()
+    st.pyplot(fig)
@@ -0,0 +1,233 @@
+# criticality_mc.py — one-group Monte Carlo k-eigenvalue solver with batched histories
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+# Particles tracked per task; fixed so results do not depend on the worker count
+CHUNK_SIZE = 4000
+
+
+def material(nu, fission, capture, scatter):
+    """One-group material from ν and macroscopic cross-sections (1/cm)."""
+    return {"nu": nu, "fission": fission, "capture": capture, "scatter": scatter}
+
+
+# One-group light water, for reflectors
+water = material(nu=0.0, fission=0.0, capture=0.0197, scatter=1.4)
+
+
+def sphere(radii, materials):
+    """Concentric spheres: radii (cm) from the centre outward, one material per shell."""
+    return {"shape": "sphere", "bounds": list(radii), "materials": list(materials)}
+
+
+def slab(half_thicknesses, materials):
+    """Symmetric slab layers, infinite in y and z: half-thicknesses (cm) from the midplane outward."""
+    return {"shape": "slab", "bounds": list(half_thicknesses), "materials": list(materials)}
+
+
+def grid(cells, pitch, materials):
+    """
+    2-D square lattice, infinite in z: cells is an integer array of indices into
+    materials and pitch is the cell width (cm).
+    """
+    return {"shape": "grid", "cells": np.asarray(cells, dtype=np.intp), "pitch": pitch,
+            "materials": list(materials)}
+
+
+def designer_grid(enrichment, rods, pitch):
+    """
+    The reactor designer's core as a one-group grid geometry. Two-group
+    constants from reactor_diagram.diffusion are collapsed with the
+    infinite-medium spectrum φ2/φ1 = Σ12/Σa2 of each cell.
+    """
+    from reactor_diagram.diffusion import group_constants
+
+    c = group_constants(np.clip(enrichment, 0, None), rods)
+    ratio = c["scatter12"] / c["absorption2"]
+    weight = 1 + ratio
+    D = (c["D1"] + c["D2"] * ratio) / weight
+    absorption = (c["absorption1"] + c["absorption2"] * ratio) / weight
+    nu_fission = (c["nu_fission1"] + c["nu_fission2"] * ratio) / weight
+    total = 1 / (3 * D)
+
+    # One material per distinct cell
+    table = np.stack([nu_fission, absorption, total], axis=-1).reshape(-1, 3)
+    unique, cells = np.unique(table, axis=0, return_inverse=True)
+    materials = [material(2.43, nf / 2.43, a - nf / 2.43, t - a) for nf, a, t in unique]
+    return grid(cells.reshape(np.shape(enrichment)), pitch, materials)
+
+
+def _tables(geometry):
+    """Per-region arrays: total cross-section, absorption probability, νΣf/Σt."""
+    mats = geometry["materials"]
+    fission = np.array([m["fission"] for m in mats], dtype=float)
+    absorption = fission + np.array([m["capture"] for m in mats], dtype=float)
+    total = absorption + np.array([m["scatter"] for m in mats], dtype=float)
+    nu_fission = np.array([m["nu"] for m in mats], dtype=float) * fission
+    return total, absorption / total, nu_fission / total
+
+
+def _region(geometry, position):
+    """Region index of every position, -1 outside the geometry."""
+    shape = geometry["shape"]
+    if shape == "grid":
+        cells = geometry["cells"]
+        i = np.floor(position[:, 1] / geometry["pitch"]).astype(np.intp)
+        j = np.floor(position[:, 0] / geometry["pitch"]).astype(np.intp)
+        inside = (i >= 0) & (i < cells.shape[0]) & (j >= 0) & (j < cells.shape[1])
+        region = np.full(len(position), -1, dtype=np.intp)
+        region[inside] = cells[i[inside], j[inside]]
+        return region
+    if shape == "sphere":
+        distance = np.sqrt(np.einsum("ij,ij->i", position, position))
+    elif shape == "slab":
+        distance = np.abs(position[:, 0])
+    else:
+        raise ValueError(f"Unknown geometry shape '{shape}'.")
+    region = np.searchsorted(geometry["bounds"], distance, side="right")
+    region[region == len(geometry["bounds"])] = -1
+    return region
+
+
+def _isotropic(rng, n):
+    mu = 2 * rng.random(n) - 1
+    phi = 2 * math.pi * rng.random(n)
+    s = np.sqrt(1 - mu ** 2)
+    return np.column_stack([s * np.cos(phi), s * np.sin(phi), mu])
+
+
+def initial_source(geometry, n, rng):
+    """n positions spread uniformly over the fissile regions of the geometry."""
+    _, _, nu_fission = _tables(geometry)
+    if geometry["shape"] == "grid":
+        height, width = geometry["cells"].shape
+        low = np.zeros(3)
+        high = np.array([width, height, 0.0]) * geometry["pitch"]
+    else:
+        extent = geometry["bounds"][-1]
+        low = np.array([-extent, -extent, -extent])
+        high = -low
+        if geometry["shape"] == "slab":
+            low[1:] = high[1:] = 0.0
+    if not (nu_fission > 0).any():
+        raise ValueError("Geometry contains no fissile material.")
+
+    sites = np.empty((0, 3))
+    while len(sites) < n:
+        candidates = low + (high - low) * rng.random((2 * n, 3))
+        region = _region(geometry, candidates)
+        keep = region >= 0
+        keep[keep] = nu_fission[region[keep]] > 0
+        sites = np.concatenate([sites, candidates[keep]])
+    return sites[:n]
+
+
+def transport(geometry, sites, k_norm, seed):
+    """
+    Follows one batch of histories to absorption or leakage with Woodcock
+    delta tracking: every particle flies to the next tentative collision
+    against the majorant cross-section, so a whole batch advances in a few
+    array operations per step regardless of region boundaries.
+
+    Fission sites are banked at real collisions, νΣf/Σt/k_norm per collision
+    on average. Returns (fission sites, collision estimate of k summed over
+    the batch).
+    """
+    rng = np.random.default_rng(seed)
+    total, absorb_probability, yield_per_collision = _tables(geometry)
+    majorant = total.max()
+
+    position = np.array(sites, dtype=float)
+    direction = _isotropic(rng, len(position))
+    alive = np.arange(len(position))
+    banked = []
+    k_sum = 0.0
+
+    while alive.size:
+        flight = -np.log(1 - rng.random(alive.size)) / majorant
+        position[alive] += direction[alive] * flight[:, None]
+        region = _region(geometry, position[alive])
+
+        inside = region >= 0
+        real = inside.copy()
+        real[inside] = rng.random(inside.sum()) * majorant < total[region[inside]]
+
+        collided, collided_region = alive[real], region[real]
+        yields = yield_per_collision[collided_region]
+        k_sum += yields.sum()
+        count = np.floor(yields / k_norm + rng.random(yields.size)).astype(np.intp)
+        banked.append(np.repeat(position[collided], count, axis=0))
+
+        absorbed = rng.random(collided.size) < absorb_probability[collided_region]
+        scattered = collided[~absorbed]
+        direction[scattered] = _isotropic(rng, scattered.size)
+
+        removed = ~inside
+        removed[real] = absorbed
+        alive = alive[~removed]
+
+    return np.concatenate(banked) if banked else np.empty((0, 3)), k_sum
+
+
+def _run_chunks(pool, geometry, source, k_norm, seed, generation):
+    chunks = [source[i:i + CHUNK_SIZE] for i in range(0, len(source), CHUNK_SIZE)]
+    # Each (generation, chunk) gets its own independent stream, so results
+    # are reproducible for a given seed whatever the number of workers.
+    seeds = [np.random.SeedSequence(seed, spawn_key=(generation, i)) for i in range(len(chunks))]
+    if pool is None:
+        results = [transport(geometry, chunk, k_norm, s) for chunk, s in zip(chunks, seeds)]
+    else:
+        results = list(pool.map(transport, [geometry] * len(chunks), chunks, [k_norm] * len(chunks), seeds))
+    bank = np.concatenate([sites for sites, _ in results])
+    return bank, sum(k for _, k in results) / len(source)
+
+
+def solve_k(geometry, particles=10000, generations=120, inactive=20, seed=12345, workers=None, k_guess=1.0):
+    """
+    Monte Carlo k-eigenvalue calculation by fission-source (generation)
+    iteration. The first `inactive` generations converge the source and are
+    discarded; k_eff is the mean over the remaining generations.
+
+    workers — processes used to transport each generation's batches; None or
+              1 runs in this process
+
+    Returns a dict with "k_eff", "std" (standard deviation of the mean),
+    "k_generations" (per active generation), "particles" and "generations".
+
+    Example:
+    fuel = material(nu=2.43, fission=0.12, capture=0.20, scatter=0.3)
+    result = solve_k(sphere([30.0], [fuel]), particles=20000)
+    """
+    if generations <= inactive:
+        raise ValueError("Need more generations than inactive generations.")
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(generations,)))
+    source = initial_source(geometry, particles, rng)
+    k_norm = k_guess
+    k_history = []
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers and workers > 1 else None
+    try:
+        for generation in range(generations):
+            bank, k_generation = _run_chunks(pool, geometry, source, k_norm, seed, generation)
+            if generation >= inactive:
+                k_history.append(k_generation)
+            k_norm = k_generation
+            if not len(bank):
+                raise RuntimeError("Fission source died out; the system is far subcritical.")
+            # Resample the bank back to a fixed population
+            take = rng.choice(len(bank), size=particles, replace=len(bank) < particles)
+            source = bank[take]
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    k_history = np.array(k_history)
+    return {
+        "k_eff": float(k_history.mean()),
+        "std": float(k_history.std(ddof=1) / math.sqrt(len(k_history))),
+        "k_generations": k_history,
+        "particles": particles,
+        "generations": generations,
+    }
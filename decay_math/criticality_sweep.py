@@ -0,0 +1,83 @@
+# criticality_sweep.py — k-effective over dense parameter grids and the k = 1 boundary
+
+import numpy as np
+from utils.lru import LRUCache
+
+SWEEP_CACHE_SIZE = 8  # grids kept per process; 10⁷ float32 points take 40 MB
+
+# Sweep parameters of the one-group model, in grid axis order
+parameters = ("nu", "sigma_f", "sigma_a")
+parameter_labels = {"nu": "ν", "sigma_f": "Σf (cm⁻¹)", "sigma_a": "Σa (cm⁻¹)"}
+
+sweep_cache = LRUCache(maxsize=SWEEP_CACHE_SIZE)
+
+
+def k_infinite_grid(nu, sigma_f, sigma_a, dtype=np.float32):
+    """
+    k_eff = ν·Σf / (Σf + Σa) on the outer-product grid of the three axes,
+    shape (len(nu), len(sigma_f), len(sigma_a)).
+
+    k is ν times a function of (Σf, Σa) alone, so that 2-D factor is
+    computed once and the full grid costs a single multiplication per point.
+    """
+    nu, sigma_f, sigma_a = (np.atleast_1d(np.asarray(v, dtype=float)) for v in (nu, sigma_f, sigma_a))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fission_fraction = (sigma_f[:, None] / (sigma_f[:, None] + sigma_a[None, :])).astype(dtype)
+    return np.multiply(nu.astype(dtype)[:, None, None], fission_fraction[None, :, :])
+
+
+def critical_boundary(axis, k, along=-1):
+    """
+    Extracts the k = 1 iso-surface as a height field. For every point of the
+    other axes it returns the value on `axis` (the coordinates along
+    dimension `along`) where k first crosses 1, linearly interpolated; NaN
+    where k stays on one side of 1.
+
+    Example:
+    boundary = critical_boundary(sigma_a, k)   # critical Σa for each (ν, Σf)
+    """
+    axis = np.asarray(axis, dtype=float)
+    k = np.moveaxis(np.asarray(k), along, -1)
+    # Boolean passes only; k is read again just at the crossing cells
+    above = k >= 1
+    crossing = above[..., :-1] != above[..., 1:]
+    i = np.argmax(crossing, axis=-1)[..., None]
+    found = np.take_along_axis(crossing, i, axis=-1)[..., 0]
+    k0 = np.take_along_axis(k, i, axis=-1)[..., 0].astype(float)
+    k1 = np.take_along_axis(k, i + 1, axis=-1)[..., 0].astype(float)
+    i = i[..., 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        boundary = axis[i] + (1.0 - k0) / (k1 - k0) * (axis[i + 1] - axis[i])
+    return np.where(found, boundary, np.nan)
+
+
+def criticality_sweep(nu_range, sigma_f_range, sigma_a_range, cache=sweep_cache):
+    """
+    k_eff over a grid given as (low, high, points) ranges per parameter,
+    cached on the ranges so revisiting a parameter space skips the work.
+
+    Returns a dict with "axes" ({parameter: array}), "k" (float32 grid in
+    `parameters` order), "critical_sigma_a" (the k = 1 surface as Σa over
+    ν × Σf), "supercritical_fraction", "k_min" and "k_max". Cached entries
+    are shared and must not be modified.
+
+    Example:
+    result = criticality_sweep((1.5, 3.5, 215), (0.01, 0.3, 215), (0.01, 0.5, 215))   # 10⁷ points
+    """
+    key = tuple((float(low), float(high), int(points)) for low, high, points in
+                (nu_range, sigma_f_range, sigma_a_range))
+    return cache.get(key, lambda: _sweep(key))
+
+
+def _sweep(key):
+    axes = {name: np.linspace(*spec) for name, spec in zip(parameters, key)}
+    k = k_infinite_grid(*axes.values())
+    supercritical = np.count_nonzero(k > 1) / k.size
+    return {
+        "axes": axes,
+        "k": k,
+        "critical_sigma_a": critical_boundary(axes["sigma_a"], k, along=2),
+        "supercritical_fraction": supercritical,
+        "k_min": float(np.nanmin(k)),
+        "k_max": float(np.nanmax(k)),
+    }
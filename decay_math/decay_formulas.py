@@ -1,12 +1,24 @@
 import numpy as np
-import matplotlib.pyplot as plt
 import math
 
 def decay_constant(half_life):
     return math.log(2) / half_life
 
 def remaining_quantity(N0, decay_const, time):
-    return N0 * math.exp(-decay_const * time)
+    return N0 * np.exp(-decay_const * np.asarray(time, dtype=float))
+
+def isotope_remaining_fraction(symbols, times_s):
+    """
+    Remaining fraction of each isotope at each time, using the pre-parsed
+    decay constants of the isotope table. Returns shape (len(symbols), len(times_s)).
+
+    Example:
+    isotope_remaining_fraction(["I-131", "Cs-137"], [0, 8 * 86400])
+    """
+    from isotopes_database.isotope_table import isotope_table
+
+    lam = isotope_table.decay_constant[isotope_table.rows(symbols)]
+    return np.exp(-np.outer(lam, np.asarray(times_s, dtype=float)))
 
 def find_time(N0, N, half_life):
     lam = decay_constant(half_life)
@@ -16,6 +28,8 @@ def estimate_half_life(N0, N, t):
     return t * math.log(2) / math.log(N0 / N)
 
 def run_decay_cli():
+    from graph_export.charts import show_chart
+
     print("\n📉 Nuclear Decay Problem Solver")
     print("----------------------------------")
     print("1. Find remaining quantity after time")
@@ -36,16 +50,7 @@ def run_decay_cli():
             print(f"Decay constant λ: {lam:.5f} 1/year")
 
             # Plot
-            times = np.linspace(0, t if t > 5 else half_life * 5, 200)
-            values = remaining_quantity(N0, lam, times)
-            plt.plot(times, values, label=f"T½ = {half_life} yr")
-            plt.title("Radioactive Decay Over Time")
-            plt.xlabel("Time (years)")
-            plt.ylabel("Remaining (N)")
-            plt.grid(True, linestyle="--", alpha=0.6)
-            plt.legend()
-            plt.tight_layout()
-            plt.show()
+            show_chart("decay", N0=N0, half_life=half_life, t=t)
 
         elif mode == "2":
             N0 = float(input("Original amount (N₀): "))
@@ -1,28 +1,32 @@
 # decay_units.py — interactive CLI for decay unit conversions
 
+from decay_math.units import convert
+
+# Thin wrappers over the unit registry; each accepts numbers or NumPy arrays
+
 def years_to_seconds(years):
-    return years * 365.25 * 24 * 3600
+    return convert(years, "y", "s")
 
 def seconds_to_years(seconds):
-    return seconds / (365.25 * 24 * 3600)
+    return convert(seconds, "s", "y")
 
 def days_to_seconds(days):
-    return days * 24 * 3600
+    return convert(days, "d", "s")
 
 def seconds_to_days(seconds):
-    return seconds / (24 * 3600)
+    return convert(seconds, "s", "d")
 
 def becquerel_to_curie(bq):
-    return bq / 3.7e10
+    return convert(bq, "Bq", "Ci")
 
 def curie_to_becquerel(ci):
-    return ci * 3.7e10
+    return convert(ci, "Ci", "Bq")
 
 def gray_to_sievert(gray, weighting=1):
-    return gray * weighting
+    return convert(gray, "Gy", "Sv", weighting)
 
 def sievert_to_gray(sv, weighting=1):
-    return sv / weighting
+    return convert(sv, "Sv", "Gy", weighting)
 
 def run_unit_converter():
     print("=== Unit Converter ===")
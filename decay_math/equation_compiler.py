@@ -0,0 +1,91 @@
+# equation_compiler.py — parse-and-compile cache for user-entered equations
+
+import re
+from utils.lru import LRUCache
+
+CACHE_SIZE = 128
+
+
+def normalize_equation(text):
+    """
+    Splits "N(t) = N0 * exp(-λ * t)" into (lhs, rhs) with insignificant
+    whitespace removed, so equations differing only in spacing share a
+    cache entry. A bare expression has an empty lhs.
+    """
+    lhs, sep, rhs = text.partition("=")
+    if not sep:
+        lhs, rhs = "", lhs
+    if "=" in rhs:
+        raise ValueError("Equation must contain at most one '='.")
+    # Whitespace only matters between two word characters ("a b" is not "ab")
+    collapse = lambda s: re.sub(r"\s+", " ", re.sub(r"\s+(?=[^\w\s])|(?<=[^\w\s])\s+", "", s.strip()))
+    rhs = collapse(rhs)
+    if not rhs:
+        raise ValueError("Equation has no right-hand side.")
+    return collapse(lhs), rhs
+
+
+expression_cache = LRUCache(maxsize=CACHE_SIZE)  # compiled expressions, keyed on the normalized rhs and symbols
+
+
+# Names that SymPy should keep as constants rather than free variables
+constants = {"pi", "E"}
+_IDENTIFIER = re.compile(r"(?<![\w.])([^\W\d]\w*)(\s*\()?")
+
+
+def equation_symbols(rhs):
+    """
+    Free variables of an expression: identifiers that are not called as
+    functions and are not constants, with "t" first and the rest in order
+    of appearance.
+
+    Example:
+    equation_symbols("N0*exp(-λ*t)") → ("t", "N0", "λ")
+    """
+    names = []
+    for name, call in _IDENTIFIER.findall(rhs):
+        if not call and name not in constants and name not in names:
+            names.append(name)
+    return tuple(sorted(names, key=lambda n: n != "t"))
+
+
+def _compile(rhs, symbols):
+    import sympy as sp
+
+    if symbols is None:
+        symbols = equation_symbols(rhs)
+    names = {name: sp.Symbol(name) for name in symbols}
+    expr = sp.sympify(rhs, locals={**names, "exp": sp.exp})
+    unknown = sorted(str(s) for s in expr.free_symbols if str(s) not in names)
+    if unknown:
+        raise ValueError(f"Unknown variable(s): {', '.join(unknown)}.")
+    return {
+        "symbols": tuple(symbols),
+        "expr": expr,
+        "latex": sp.latex(expr),
+        "function": sp.lambdify([names[n] for n in symbols], expr, modules=["numpy"]),
+    }
+
+
+def compile_equation(text, symbols=None, cache=expression_cache):
+    """
+    Parses and compiles an equation's right-hand side into a NumPy function
+    through the shared cache: repeated calls with the same equation skip
+    sympify/lambdify entirely.
+
+    symbols — argument names in order; None detects them from the equation
+              (see equation_symbols)
+
+    Returns a dict with "lhs", "symbols", "expr" (SymPy), "latex" and
+    "function". Raises ValueError (or a SymPy parsing error) for invalid
+    equations.
+
+    Example:
+    compiled = compile_equation("N(t) = N0 * exp(-λ * t)")
+    compiled["symbols"] → ("t", "N0", "λ")
+    compiled["function"](np.linspace(0, 50, 300), 100.0, 0.1)
+    """
+    lhs, rhs = normalize_equation(text)
+    symbols = None if symbols is None else tuple(symbols)
+    entry = cache.get((rhs, symbols), lambda: _compile(rhs, symbols))
+    return {"lhs": lhs, **entry}
@@ -0,0 +1,114 @@
+# units.py — dimension-aware unit registry with precomputed conversion factors
+
+import numpy as np
+
+# SI prefixes generated for the metric units below
+_prefixes = {"p": 1e-12, "n": 1e-9, "μ": 1e-6, "m": 1e-3, "": 1.0, "k": 1e3, "M": 1e6, "G": 1e9, "T": 1e12}
+
+SECONDS_PER_YEAR = 365.25 * 24 * 3600  # Julian year
+
+# Time units, in seconds
+time_units = {"ns": 1e-9, "μs": 1e-6, "ms": 1e-3, "s": 1.0, "min": 60.0, "h": 3600.0, "d": 86400.0,
+              "wk": 7 * 86400.0, "y": SECONDS_PER_YEAR}
+
+# (dimension, factor to the dimension's base unit) for every unit
+units = {}
+for _name, _factor in time_units.items():
+    units[_name] = ("time", _factor)
+for _prefix, _scale in _prefixes.items():
+    units[f"{_prefix}Bq"] = ("activity", _scale)
+    units[f"{_prefix}Sv"] = ("dose", _scale)
+    units[f"{_prefix}Gy"] = ("absorbed_dose", _scale)
+    units[f"{_prefix}eV"] = ("energy", _scale)
+for _prefix in ("p", "n", "μ", "m", "", "k"):
+    units[f"{_prefix}Ci"] = ("activity", _prefixes[_prefix] * 3.7e10)
+for _prefix in ("μ", "m", ""):
+    units[f"{_prefix}rem"] = ("dose", _prefixes[_prefix] * 0.01)
+    units[f"{_prefix}rad"] = ("absorbed_dose", _prefixes[_prefix] * 0.01)
+units["J"] = ("energy", 1 / 1.602176634e-19)
+# Dose rates: every dose unit per every time unit from seconds to years
+for _name, (_dimension, _factor) in list(units.items()):
+    if _dimension in ("dose", "absorbed_dose"):
+        for _time in ("s", "min", "h", "d", "y"):
+            units[f"{_name}/{_time}"] = (f"{_dimension}_rate", _factor / time_units[_time])
+
+# Spellings accepted in addition to the canonical symbols
+aliases = {"sec": "s", "second": "s", "seconds": "s", "minute": "min", "minutes": "min", "hr": "h",
+           "hour": "h", "hours": "h", "day": "d", "days": "d", "week": "wk", "weeks": "wk", "yr": "y",
+           "year": "y", "years": "y", "a": "y"}
+
+# Equivalent dose = absorbed dose × radiation weighting factor
+_weighted = {("absorbed_dose", "dose"): 1, ("dose", "absorbed_dose"): -1,
+             ("absorbed_dose_rate", "dose_rate"): 1, ("dose_rate", "absorbed_dose_rate"): -1}
+
+
+def _ratio(a, b):
+    # Rounded to 15 significant digits so decimal ratios stay exact (rad/h → mSv/h is 10.0)
+    return float(f"{units[a][1] / units[b][1]:.15g}")
+
+
+# Every pairwise factor within a dimension, computed once
+_factors = {(a, b): _ratio(a, b) for a in units for b in units if units[a][0] == units[b][0]}
+
+
+def canonical_unit(unit):
+    """
+    Canonical symbol for a unit spelling: "µSv/hour" → "μSv/h", "uCi" → "μCi".
+    Raises ValueError for unknown units.
+    """
+    text = str(unit).strip().replace("µ", "μ")
+    numerator, slash, denominator = text.partition("/")
+    if slash:
+        text = f"{numerator}/{aliases.get(denominator, denominator)}"
+    else:
+        text = aliases.get(text, text)
+    if text not in units and text.startswith("u") and "μ" + text[1:] in units:
+        text = "μ" + text[1:]
+    if text not in units:
+        raise ValueError(f"Unknown unit '{unit}'.")
+    return text
+
+
+def dimension(unit):
+    """Dimension of a unit: time, activity, dose, absorbed_dose, energy, dose_rate, absorbed_dose_rate."""
+    return units[canonical_unit(unit)][0]
+
+
+def units_of(dim):
+    """Canonical units of a dimension, smallest first."""
+    return sorted((u for u, (d, _) in units.items() if d == dim), key=lambda u: units[u][1])
+
+
+def factor(from_unit, to_unit, weighting=1.0):
+    """
+    Multiplier taking values in from_unit to to_unit. Absorbed dose (rate)
+    converts to equivalent dose (rate) and back through the radiation
+    weighting factor.
+
+    Example:
+    factor("mSv", "rem") → 0.1
+    factor("Gy", "Sv", weighting=20) → 20.0
+    """
+    a, b = canonical_unit(from_unit), canonical_unit(to_unit)
+    if (a, b) in _factors:
+        return _factors[(a, b)]
+    direction = _weighted.get((units[a][0], units[b][0]))
+    if direction is None:
+        raise ValueError(f"Cannot convert {units[a][0]} ({a}) to {units[b][0]} ({b}).")
+    return _ratio(a, b) * weighting ** direction
+
+
+def convert(values, from_unit, to_unit, weighting=1.0, out=None):
+    """
+    Converts a number or array with a single multiplication by the
+    precomputed factor; pass out to convert an array in place.
+
+    Example:
+    convert(np.array([1.0, 2.5]), "Ci", "GBq") → array([37., 92.5])
+    """
+    scale = factor(from_unit, to_unit, weighting)
+    if out is not None:
+        return np.multiply(values, scale, out=out)
+    if np.ndim(values) == 0:
+        return float(values) * scale
+    return np.asarray(values) * scale
@@ -1,5 +1,32 @@
 # dose_categories.py
 
+import numpy as np
+
+# (upper bound in mSv, name, description, icon, color), in increasing order;
+# the last category has no upper bound.
+dose_categories = [
+    (0.1, "Very Low", "Typical background radiation or minor diagnostics. No health risk.", "🟢", "green"),
+    (10, "Low", "Comparable to X-rays or flights. Low long-term risk.", "🟡", "yellow"),
+    (100, "Moderate", "Occupational level. Slight increased cancer risk over years.", "🟠", "orange"),
+    (1000, "High", "Acute exposure zone. Risk of symptoms, seek evaluation.", "🔴", "red"),
+    (np.inf, "Extreme", "Dangerous or potentially fatal dose. Emergency situation.", "☠️", "darkred"),
+]
+category_bounds = np.array([c[0] for c in dose_categories[:-1]])
+category_names = [c[1] for c in dose_categories]
+
+
+def category_index(dose_mSv):
+    """
+    Index into dose_categories for a dose or a whole array of doses, by a
+    binary search of the category bounds (each bound belongs to the lower
+    category).
+
+    Example:
+    category_index([0.05, 5, 2000]) → array([0, 1, 4])
+    """
+    return np.searchsorted(category_bounds, dose_mSv, side="left")
+
+
 def categorize_dose(dose_mSv: float):
     """
     Categorizes the dose and returns a tuple:
@@ -9,38 +36,4 @@ def categorize_dose(dose_mSv: float):
     categorize_dose(0.05)
     → ("Very Low", "No health risk", "🟢", "green")
     """
-    if dose_mSv <= 0.1:
-        return (
-            "Very Low",
-            "Typical background radiation or minor diagnostics. No health risk.",
-            "🟢",
-            "green"
-        )
-    elif dose_mSv <= 10:
-        return (
-            "Low",
-            "Comparable to X-rays or flights. Low long-term risk.",
-            "🟡",
-            "yellow"
-        )
-    elif dose_mSv <= 100:
-        return (
-            "Moderate",
-            "Occupational level. Slight increased cancer risk over years.",
-            "🟠",
-            "orange"
-        )
-    elif dose_mSv <= 1000:
-        return (
-            "High",
-            "Acute exposure zone. Risk of symptoms, seek evaluation.",
-            "🔴",
-            "red"
-        )
-    else:
-        return (
-            "Extreme",
-            "Dangerous or potentially fatal dose. Emergency situation.",
-            "☠️",
-            "darkred"
-        )
\ No newline at end of file
+    return dose_categories[int(category_index(dose_mSv))][1:]
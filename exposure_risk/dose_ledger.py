@@ -0,0 +1,93 @@
+# dose_ledger.py — annual dose accounting for whole workforces
+
+import os
+import numpy as np
+import pandas as pd
+from exposure_risk.dose_categories import category_index, category_names
+from exposure_risk.exposure_calc import OCCUPATIONAL_LIMIT_mSv, PUBLIC_LIMIT_mSv, annual_dose, cancer_risk
+
+# Input columns: hours exposed per day, dose rate (μSv/h) and exposed days per
+# year. "days" is optional and defaults to a full year.
+ledger_columns = {"hours_per_day": "float64", "rate_uSv_per_hour": "float64", "days": "float64"}
+DEFAULT_DAYS = 365
+
+
+def read_ledger(source):
+    """
+    Reads a worker table from CSV or Parquet, chosen by the extension of a
+    path or of a file object's name (e.g. a Streamlit upload). Only the
+    ledger columns that are present, plus any "worker" id column, are
+    loaded, with fixed dtypes so pandas skips type inference.
+    """
+    extension = os.path.splitext(str(getattr(source, "name", source)))[1].lower()
+    if extension in (".parquet", ".pq"):
+        return pd.read_parquet(source)
+    if extension not in (".csv", ".txt", ".gz"):
+        raise ValueError(f"Unsupported ledger file type '{extension}'; use CSV or Parquet.")
+    header = pd.read_csv(source, nrows=0).columns
+    if hasattr(source, "seek"):
+        source.seek(0)
+    wanted = [c for c in header if c in ledger_columns or c == "worker"]
+    return pd.read_csv(source, usecols=wanted, dtype={c: ledger_columns[c] for c in wanted if c in ledger_columns})
+
+
+def compute_ledger(workers):
+    """
+    Annual dose accounting for every row of a worker table (DataFrame or
+    dict of columns) in a few column operations:
+
+    - "annual_dose_mSv"
+    - "category" (categorical, see dose_categories), binned by binary search
+    - "cancer_risk"
+    - "over_public_limit" / "over_occupational_limit"
+
+    Returns a new DataFrame with the input columns followed by the results.
+
+    Example:
+    compute_ledger({"hours_per_day": [2, 8], "rate_uSv_per_hour": [0.5, 20]})
+    """
+    ledger = pd.DataFrame(workers)
+    missing = [c for c in ("hours_per_day", "rate_uSv_per_hour") if c not in ledger]
+    if missing:
+        raise ValueError(f"Ledger is missing column(s): {', '.join(missing)}.")
+    hours = ledger["hours_per_day"].to_numpy(dtype=float)
+    rate = ledger["rate_uSv_per_hour"].to_numpy(dtype=float)
+    days = ledger["days"].to_numpy(dtype=float) if "days" in ledger else DEFAULT_DAYS
+    # Negated comparisons so missing values (NaN) fail too instead of binning as "Extreme"
+    if not ((hours >= 0) & (hours <= 24)).all():
+        raise ValueError("hours_per_day must be between 0 and 24.")
+    if not (rate >= 0).all():
+        raise ValueError("rate_uSv_per_hour must be zero or positive.")
+    if not (np.asarray(days) >= 0).all():
+        raise ValueError("days must be zero or positive.")
+
+    dose = annual_dose(hours, rate, days)
+    codes = category_index(dose)
+    ledger["annual_dose_mSv"] = dose
+    ledger["category"] = pd.Categorical.from_codes(codes, categories=category_names, validate=False)
+    ledger["cancer_risk"] = cancer_risk(dose)
+    ledger["over_public_limit"] = dose > PUBLIC_LIMIT_mSv
+    ledger["over_occupational_limit"] = dose > OCCUPATIONAL_LIMIT_mSv
+    return ledger
+
+
+def summarize_ledger(ledger):
+    """Workforce totals: headcount per category, limit breaches and dose statistics."""
+    dose = ledger["annual_dose_mSv"].to_numpy()
+    counts = np.bincount(ledger["category"].cat.codes.to_numpy(), minlength=len(category_names))
+    return {
+        "workers": len(ledger),
+        "per_category": dict(zip(category_names, counts.tolist())),
+        "over_public_limit": int(ledger["over_public_limit"].sum()),
+        "over_occupational_limit": int(ledger["over_occupational_limit"].sum()),
+        "collective_dose_mSv": float(dose.sum()),
+        "max_dose_mSv": float(dose.max()) if dose.size else 0.0,
+    }
+
+
+def write_ledger(ledger, path):
+    """Writes a computed ledger to CSV or Parquet, chosen by extension."""
+    if str(path).lower().endswith((".parquet", ".pq")):
+        ledger.to_parquet(path, index=False)
+    else:
+        ledger.to_csv(path, index=False)
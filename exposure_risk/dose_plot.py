@@ -1,7 +1,5 @@
 # dose_plot.py
 
-import matplotlib.pyplot as plt
-
 # Predefined radiation exposure levels (in mSv)
 exposure_levels = {
     "Dental X-ray": 0.005,
@@ -14,23 +12,9 @@ exposure_levels = {
 }
 
 def plot_exposure_levels():
-    activities = list(exposure_levels.keys())
-    doses = list(exposure_levels.values())
-
-    plt.figure(figsize=(10, 6))
-    bars = plt.barh(activities, doses, color='tomato')
-    plt.xlabel("Dose (mSv)")
-    plt.title("Radiation Exposure Levels from Various Sources")
-    plt.xscale('log')
-    plt.grid(True, which='both', linestyle='--', linewidth=0.5)
-
-    # Add labels to each bar
-    for bar, dose in zip(bars, doses):
-        plt.text(dose * 1.05, bar.get_y() + bar.get_height()/2,
-                 f"{dose} mSv", va='center')
+    from graph_export.charts import show_chart
 
-    plt.tight_layout()
-    plt.show()
+    show_chart("exposure_levels")
 
 if __name__ == "__main__":
     plot_exposure_levels()
\ No newline at end of file
@@ -0,0 +1,217 @@
+# dosimeter_stream.py — streaming ingestion of electronic dosimeter logs
+
+import sys
+import numpy as np
+import pandas as pd
+from decay_math.units import factor
+from exposure_risk.exposure_calc import OCCUPATIONAL_LIMIT_mSv
+
+# Rolling windows (calendar days, UTC) kept for every worker
+windows = {"day": 1, "quarter": 91, "year": 365}
+# Alert thresholds (μSv) per window; the year threshold is the occupational limit
+default_limits_uSv = {"day": 1000.0, "quarter": 12500.0, "year": OCCUPATIONAL_LIMIT_mSv * factor("mSv", "μSv")}
+
+RING_DAYS = 366  # daily bins per worker, enough for the longest window
+CHUNK_ROWS = 500_000
+MAX_GAP_S = factor("h", "s")  # longest interval a single rate sample is credited for
+SECONDS_PER_DAY = factor("d", "s")
+SECONDS_TO_HOURS = factor("s", "h")
+
+
+def new_state():
+    """
+    Empty ingestion state. Its size grows with the number of workers only:
+    per worker a running total, the last sample time and a ring of daily
+    dose bins stamped with the day they hold.
+    """
+    return {
+        "index": {},
+        "workers": [],
+        "cumulative": np.zeros(0),
+        "last_time": np.zeros(0),
+        "daily": np.zeros((0, RING_DAYS)),
+        "bin_day": np.zeros((0, RING_DAYS), dtype=np.int64),
+        "rows": 0,
+    }
+
+
+def _worker_rows(state, workers):
+    """State row of every sample's worker, adding workers seen for the first time."""
+    codes, uniques = pd.factorize(workers)
+    index = state["index"]
+    new = [w for w in uniques if w not in index]
+    if new:
+        for w in new:
+            index[w] = len(state["workers"])
+            state["workers"].append(w)
+        n = len(new)
+        state["cumulative"] = np.concatenate([state["cumulative"], np.zeros(n)])
+        state["last_time"] = np.concatenate([state["last_time"], np.full(n, np.nan)])
+        state["daily"] = np.concatenate([state["daily"], np.zeros((n, RING_DAYS))])
+        state["bin_day"] = np.concatenate([state["bin_day"], np.full((n, RING_DAYS), -1, dtype=np.int64)])
+    return np.array([index[w] for w in uniques], dtype=np.intp)[codes]
+
+
+def _grouped_cumsum(keys, values):
+    """Running sum of values within each key, in the original row order."""
+    order = np.argsort(keys, kind="stable")
+    sorted_keys, running = keys[order], np.cumsum(values[order])
+    starts = np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]
+    offset = np.maximum.accumulate(np.where(starts, np.arange(keys.size), 0))
+    running -= (running - values[order])[offset]
+    out = np.empty_like(running)
+    out[order] = running
+    return out
+
+
+def ingest_chunk(state, workers, times_s, rates_uSv_per_hour=None, doses_uSv=None, limits_uSv=None,
+                 max_gap_s=MAX_GAP_S):
+    """
+    Adds one chunk of dosimeter samples to the state and returns the limit
+    exceedance events it triggered, in time order.
+
+    Each sample is either a dose rate, credited over the time since the
+    worker's previous sample (at most max_gap_s), or an explicit dose.
+    Samples are processed one calendar day at a time; within a day every
+    worker's running window totals are a grouped cumulative sum, so an
+    event is reported at the exact sample that crosses a threshold.
+
+    Events are dicts with "worker", "time_s", "window", "total_uSv" and
+    "limit_uSv".
+    """
+    limits = default_limits_uSv if limits_uSv is None else limits_uSv
+    times = np.asarray(times_s, dtype=float)
+    order = np.argsort(times, kind="stable")
+    times = times[order]
+    rows = _worker_rows(state, np.asarray(workers)[order])
+    state["rows"] += rows.size
+
+    if doses_uSv is not None:
+        dose = np.asarray(doses_uSv, dtype=float)[order]
+    else:
+        rates = np.asarray(rates_uSv_per_hour, dtype=float)[order]
+        # Previous sample of the same worker: earlier in this chunk, else from the state
+        by_worker = np.lexsort((times, rows))
+        previous = np.empty_like(times)
+        previous[by_worker] = np.r_[np.nan, times[by_worker][:-1]]
+        first = np.r_[True, rows[by_worker][1:] != rows[by_worker][:-1]]
+        previous[by_worker[first]] = state["last_time"][rows[by_worker[first]]]
+        interval = np.clip(np.nan_to_num(times - previous, nan=0.0), 0, max_gap_s)
+        dose = rates * interval * SECONDS_TO_HOURS
+    dose = np.nan_to_num(dose)
+
+    days = np.floor(times / SECONDS_PER_DAY).astype(np.int64)
+    bounds = np.r_[0, np.nonzero(np.diff(days))[0] + 1, days.size]
+    daily, bin_day = state["daily"], state["bin_day"]
+    events = []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        day, slot = days[start], days[start] % RING_DAYS
+        day_rows, day_dose = rows[start:stop], dose[start:stop]
+        present = np.unique(day_rows)
+
+        # Start today's bin for workers whose bin still holds an older day
+        stale = present[bin_day[present, slot] != day]
+        daily[stale, slot] = 0.0
+        bin_day[stale, slot] = day
+
+        running = _grouped_cumsum(day_rows, day_dose)
+        for window, length in windows.items():
+            limit = limits.get(window)
+            if limit is None:
+                continue
+            in_window = bin_day[present] > day - length
+            base = np.zeros(len(daily))
+            base[present] = np.where(in_window, daily[present], 0.0).sum(axis=1)
+            after = base[day_rows] + running
+            crossed = np.nonzero((after > limit) & (after - day_dose <= limit))[0]
+            events += [{"worker": state["workers"][day_rows[i]], "time_s": float(times[start + i]),
+                        "window": window, "total_uSv": float(after[i]), "limit_uSv": float(limit)}
+                       for i in crossed]
+
+        np.add.at(daily[:, slot], day_rows, day_dose)
+
+    np.add.at(state["cumulative"], rows, dose)
+    state["last_time"][rows] = times  # rows are in time order, so the latest sample wins
+    events.sort(key=lambda e: e["time_s"])
+    return events
+
+
+def _seconds(column):
+    if pd.api.types.is_numeric_dtype(column):
+        return column.to_numpy(dtype=float)
+    stamps = pd.to_datetime(column, utc=True, format="ISO8601")
+    return stamps.to_numpy(dtype="datetime64[ns]").astype(np.int64) / 1e9
+
+
+def stream_dosimeter_log(path, state=None, chunk_rows=CHUNK_ROWS, limits_uSv=None, max_gap_s=MAX_GAP_S):
+    """
+    Reads a dosimeter log CSV chunk_rows rows at a time and yields limit
+    exceedance events as soon as the chunk containing them is processed.
+    Memory stays bounded by the chunk size and the number of workers, not
+    the file size. The log needs "worker" and "timestamp" (ISO 8601 or
+    epoch seconds) columns and either "rate_uSv_per_hour" or "dose_uSv";
+    samples should be in (roughly) chronological order.
+
+    Pass a state from new_state() to read the per-worker totals afterwards
+    (see worker_totals) or to continue across several files.
+
+    Example:
+    state = new_state()
+    for event in stream_dosimeter_log("badges_2024.csv", state):
+        print(event["worker"], event["window"], event["total_uSv"])
+    totals = worker_totals(state)
+    """
+    state = new_state() if state is None else state
+    header = pd.read_csv(path, nrows=0).columns
+    if "worker" not in header or "timestamp" not in header:
+        raise ValueError("Dosimeter log needs 'worker' and 'timestamp' columns.")
+    value = "dose_uSv" if "dose_uSv" in header else "rate_uSv_per_hour"
+    if value not in header:
+        raise ValueError("Dosimeter log needs a 'rate_uSv_per_hour' or 'dose_uSv' column.")
+
+    reader = pd.read_csv(path, usecols=["worker", "timestamp", value], chunksize=chunk_rows,
+                         dtype={"worker": str, value: "float64"})
+    for chunk in reader:
+        samples = chunk[value].to_numpy()
+        events = ingest_chunk(state, chunk["worker"].to_numpy(), _seconds(chunk["timestamp"]),
+                              rates_uSv_per_hour=None if value == "dose_uSv" else samples,
+                              doses_uSv=samples if value == "dose_uSv" else None,
+                              limits_uSv=limits_uSv, max_gap_s=max_gap_s)
+        yield from events
+
+
+def worker_totals(state, day=None):
+    """
+    Per-worker cumulative dose and rolling window totals (μSv) as of `day`
+    (days since the epoch; default each worker's last sample day).
+    """
+    last_day = np.floor(np.nan_to_num(state["last_time"]) / SECONDS_PER_DAY).astype(np.int64)
+    day = last_day if day is None else np.full(len(last_day), day)
+    totals = {"worker": state["workers"], "cumulative_uSv": state["cumulative"]}
+    for window, length in windows.items():
+        valid = (state["bin_day"] > (day - length)[:, None]) & (state["bin_day"] <= day[:, None])
+        totals[f"{window}_uSv"] = np.where(valid, state["daily"], 0.0).sum(axis=1)
+    return pd.DataFrame(totals)
+
+
+def main(argv=None):
+    """python -m exposure_risk.dosimeter_stream LOG.csv [TOTALS.csv] — prints events as they occur."""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Usage: python -m exposure_risk.dosimeter_stream LOG.csv [TOTALS.csv]")
+        return 2
+    state = new_state()
+    for event in stream_dosimeter_log(argv[0], state):
+        when = pd.Timestamp(event["time_s"], unit="s", tz="UTC")
+        print(f"{when:%Y-%m-%d %H:%M:%S} {event['worker']}: {event['window']} dose "
+              f"{event['total_uSv'] / 1000:.3f} mSv exceeds {event['limit_uSv'] / 1000:g} mSv", flush=True)
+    totals = worker_totals(state)
+    print(f"{state['rows']:,} samples, {len(totals):,} workers")
+    if len(argv) > 1:
+        totals.to_csv(argv[1], index=False)
+        print(f"Totals written to {argv[1]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
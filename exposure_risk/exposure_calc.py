@@ -1,43 +1,44 @@
-import matplotlib.pyplot as plt
+from decay_math.units import factor
 
-def annual_dose(hours_per_day, rate_uSv_per_hour):
-    return hours_per_day * 365 * rate_uSv_per_hour / 1000  # mSv
+PUBLIC_LIMIT_mSv = 1  # annual effective dose limit, members of the public
+OCCUPATIONAL_LIMIT_mSv = 50  # annual effective dose limit, radiation workers (single year)
+RISK_PER_mSv = 0.005  # cancer risk factor used throughout the toolbox
+USV_TO_MSV = factor("μSv", "mSv")
+
+def annual_dose(hours_per_day, rate_uSv_per_hour, days=365):
+    # Plain arithmetic, so scalars and whole NumPy/pandas columns both work
+    return hours_per_day * days * rate_uSv_per_hour * USV_TO_MSV
+
+def cancer_risk(dose_mSv):
+    return dose_mSv * RISK_PER_mSv
 
 def plot_annual_dose(daily_mSv):
-    days = list(range(1, 366))
-    cumulative_dose = [daily_mSv * d for d in days]
-
-    plt.figure(figsize=(9, 4))
-    plt.plot(days, cumulative_dose, label="Cumulative Dose (mSv)", color="red")
-    plt.axhline(1, color="green", linestyle="--", label="Public Limit (1 mSv)")
-    plt.axhline(5, color="orange", linestyle="--", label="Occupational Limit (5 mSv)")
-    plt.xlabel("Day of Year")
-    plt.ylabel("Total Dose (mSv)")
-    plt.title("Radiation Dose Accumulation Over 1 Year")
-    plt.ylim(0, max(6, max(cumulative_dose) + 0.5))
-    plt.grid(True, linestyle="--", alpha=0.4)
-    plt.legend()
-    plt.tight_layout()
-    plt.show()
+    from graph_export.charts import show_chart
+
+    show_chart("annual_dose", daily_mSv=daily_mSv)
 
 def run_exposure_cli():
+    from graph_export.charts import show_chart
+    from exposure_risk.dose_ledger import compute_ledger, read_ledger, summarize_ledger, write_ledger
+
     while True:
         print("\nRadiation Exposure Calculator")
         print("------------------------------")
         print("1. Estimate safe daily hours (public dose limit)")
         print("2. Compare two worker exposure scenarios")
         print("3. Emergency radiation exposure dose")
-        print("4. Exit")
+        print("4. Process a worker dose ledger (CSV/Parquet)")
+        print("5. Exit")
 
-        choice = input("Choose option (1–4): ")
+        choice = input("Choose option (1–5): ")
 
         if choice == "1":
             target_mSv = float(input("Enter max annual dose in mSv (e.g. 1): "))
             rate = float(input("Radiation level in μSv/h: "))
-            safe_hours = (target_mSv * 1000) / (365 * rate)
+            safe_hours = target_mSv / (365 * rate * USV_TO_MSV)
             print(f"Safe daily exposure time: {safe_hours:.2f} hours/day")
             # Plot what happens if user actually works that much
-            daily_mSv = safe_hours * rate / 1000
+            daily_mSv = safe_hours * rate * USV_TO_MSV
             plot_annual_dose(daily_mSv)
 
         elif choice == "2":
@@ -48,37 +49,24 @@ def run_exposure_cli():
             b_hours = float(input("Hours/day: "))
             b_rate = float(input("Radiation level in μSv/h: "))
 
-            a_dose = annual_dose(a_hours, a_rate)
-            b_dose = annual_dose(b_hours, b_rate)
+            ledger = compute_ledger({"hours_per_day": [a_hours, b_hours], "rate_uSv_per_hour": [a_rate, b_rate]})
+            a_dose, b_dose = ledger["annual_dose_mSv"]
 
             print(f"\nWorker A Annual Dose: {a_dose:.3f} mSv")
             print(f"Worker B Annual Dose: {b_dose:.3f} mSv")
+            for name, row in zip("AB", ledger.itertuples()):
+                print(f"Worker {name}: {row.category}, cancer risk {row.cancer_risk:.2%}")
 
             winner = "A" if a_dose > b_dose else "B" if b_dose > a_dose else "Neither"
             print(f"{winner} receives more radiation annually." if winner != "Neither" else "Both receive equal doses.")
 
             # Plot both
-            days = list(range(1, 366))
-            dose_A = [a_dose / 365 * d for d in days]
-            dose_B = [b_dose / 365 * d for d in days]
-
-            plt.figure(figsize=(9, 4))
-            plt.plot(days, dose_A, label="Worker A", color="blue")
-            plt.plot(days, dose_B, label="Worker B", color="purple")
-            plt.axhline(1, color="green", linestyle="--", label="Public Limit")
-            plt.axhline(5, color="orange", linestyle="--", label="Worker Limit")
-            plt.xlabel("Day of Year")
-            plt.ylabel("Cumulative Dose (mSv)")
-            plt.title("Dose Comparison: Worker A vs. B")
-            plt.grid(True, linestyle="--", alpha=0.4)
-            plt.legend()
-            plt.tight_layout()
-            plt.show()
+            show_chart("worker_comparison", a_dose=a_dose, b_dose=b_dose)
 
         elif choice == "3":
             hrs = float(input("Exposure duration (hours): "))
             rate = float(input("Radiation level in μSv/h: "))
-            dose = hrs * rate / 1000
+            dose = hrs * rate * USV_TO_MSV
             print(f"Estimated Emergency Dose: {dose:.3f} mSv")
             if dose > 10:
                 print("High dose. Acute effects possible.")
@@ -88,23 +76,33 @@ def run_exposure_cli():
                 print("Within short-term safety limits.")
 
             # Show fixed point graph
-            plt.figure(figsize=(6, 3))
-            plt.bar(["Emergency Dose"], [dose], color="red")
-            plt.axhline(1, color="green", linestyle="--", label="Public Limit")
-            plt.axhline(5, color="orange", linestyle="--", label="Worker Limit")
-            plt.ylabel("Dose (mSv)")
-            plt.title("Emergency Radiation Exposure")
-            plt.ylim(0, max(6, dose + 1))
-            plt.legend()
-            plt.tight_layout()
-            plt.show()
+            show_chart("emergency_dose", dose=dose)
 
         elif choice == "4":
+            path = input("Ledger file (columns hours_per_day, rate_uSv_per_hour[, days]): ").strip()
+            try:
+                ledger = compute_ledger(read_ledger(path))
+            except (OSError, ValueError) as e:
+                print(f"Could not process ledger: {e}")
+                continue
+            summary = summarize_ledger(ledger)
+            print(f"\nWorkers: {summary['workers']:,}")
+            for name, count in summary["per_category"].items():
+                print(f"  {name}: {count:,}")
+            print(f"Over public limit ({PUBLIC_LIMIT_mSv} mSv): {summary['over_public_limit']:,}")
+            print(f"Over occupational limit ({OCCUPATIONAL_LIMIT_mSv} mSv): {summary['over_occupational_limit']:,}")
+            print(f"Collective dose: {summary['collective_dose_mSv']:,.1f} mSv")
+            out = input("Save results to (blank to skip): ").strip()
+            if out:
+                write_ledger(ledger, out)
+                print(f"Saved {out}")
+
+        elif choice == "5":
             print("Exiting calculator.")
             break
 
         else:
-            print("Invalid option. Please select 1–4.")
+            print("Invalid option. Please select 1–5.")
 
 if __name__ == "__main__":
     run_exposure_cli()
\ No newline at end of file
@@ -0,0 +1,32 @@
+# __main__.py — python -m graph_export SCENARIOS.json OUT_DIR [--format png svg pdf] [--workers N]
+
+import argparse
+import os
+import sys
+import time
+from graph_export.batch import DEFAULT_DPI, export_batch, load_scenarios
+from graph_export.charts import EXPORT_FORMATS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m graph_export",
+                                     description="Render a batch of report charts without a display.")
+    parser.add_argument("scenarios", help="JSON list of {chart, name, params} scenarios")
+    parser.add_argument("out_dir", help="directory for the rendered files")
+    parser.add_argument("--format", nargs="+", default=["png"], choices=EXPORT_FORMATS, dest="formats")
+    parser.add_argument("--dpi", type=int, default=DEFAULT_DPI)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        written = export_batch(load_scenarios(args.scenarios), args.out_dir, args.formats, args.dpi, args.workers)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Export failed: {e}", file=sys.stderr)
+        return 1
+    print(f"Wrote {len(written)} files to {args.out_dir} in {time.perf_counter() - start:.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+# batch.py — headless batch rendering of report charts across a process pool
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from graph_export.charts import EXPORT_FORMATS, chart_filename, charts
+
+DEFAULT_DPI = 150
+
+
+def load_scenarios(path):
+    """
+    Reads a JSON list of scenarios:
+    [{"chart": "decay", "name": "cs137", "params": {"N0": 100, "half_life": 30.17}}, ...]
+    """
+    with open(path, encoding="utf-8") as f:
+        scenarios = json.load(f)
+    if not isinstance(scenarios, list):
+        raise ValueError("Scenario file must contain a JSON list.")
+    return scenarios
+
+
+def _use_agg():
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def render_scenarios(scenarios, out_dir, formats=("png",), dpi=DEFAULT_DPI):
+    """
+    Renders scenarios in this process and returns the written paths.
+
+    One Figure per chart type is created and reused: it is cleared before
+    each scenario, and all of them are released when the batch ends. The
+    figures are plain matplotlib.figure.Figure objects, never registered
+    with pyplot, so nothing accumulates in pyplot's figure manager.
+    """
+    from matplotlib.figure import Figure
+
+    figures = {}
+    written = []
+    try:
+        for scenario in scenarios:
+            draw, figsize = charts[scenario["chart"]]
+            fig = figures.get(scenario["chart"])
+            if fig is None:
+                fig = figures[scenario["chart"]] = Figure(figsize=figsize)
+            else:
+                fig.clear()
+            draw(fig.subplots(), **scenario.get("params", {}))
+            fig.tight_layout()
+            stem = os.path.join(out_dir, chart_filename(scenario["name"]))
+            for fmt in formats:
+                fig.savefig(f"{stem}.{fmt}", format=fmt, dpi=dpi)
+                written.append(f"{stem}.{fmt}")
+    finally:
+        for fig in figures.values():
+            fig.clear()
+        figures.clear()
+    return written
+
+
+def export_batch(scenarios, out_dir, formats=("png",), dpi=DEFAULT_DPI, workers=None):
+    """
+    Renders a batch of chart scenarios to files in out_dir, one file per
+    scenario and format (png, svg or pdf), on the non-interactive Agg
+    backend. With workers > 1 the scenarios are grouped by chart type (so
+    each worker reuses its figures) and split across a process pool.
+
+    Scenarios are dicts with "chart" (a key of graph_export.charts.charts),
+    "params" (keyword arguments of its draw function) and an optional
+    "name" used as the file stem; names must be unique.
+
+    Returns the written paths in scenario order.
+
+    Example:
+    export_batch([{"chart": "annual_dose", "name": "lab_a", "params": {"daily_mSv": 0.004}},
+                  {"chart": "exposure_levels", "name": "reference"}], "reports", formats=("png", "pdf"))
+    """
+    formats = tuple(f.lower().lstrip(".") for f in formats)
+    unknown = [f for f in formats if f not in EXPORT_FORMATS]
+    if unknown:
+        raise ValueError(f"Unsupported format(s): {', '.join(unknown)}.")
+    scenarios = [dict(s, name=s.get("name") or f"{s['chart']}_{i:04d}") for i, s in enumerate(scenarios)]
+    missing = sorted({s["chart"] for s in scenarios} - set(charts))
+    if missing:
+        raise ValueError(f"Unknown chart(s): {', '.join(missing)}.")
+    stems = [chart_filename(s["name"]) for s in scenarios]
+    if len(set(stems)) != len(stems):
+        raise ValueError("Scenario names must be unique.")
+    os.makedirs(out_dir, exist_ok=True)
+
+    if not workers or workers <= 1 or len(scenarios) < 2:
+        _use_agg()
+        return render_scenarios(scenarios, out_dir, formats, dpi)
+
+    ordered = sorted(scenarios, key=lambda s: s["chart"])
+    size = -(-len(ordered) // workers)
+    batches = [ordered[i:i + size] for i in range(0, len(ordered), size)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_use_agg) as pool:
+        written = [path for paths in pool.map(render_scenarios, batches, [out_dir] * len(batches),
+                                              [formats] * len(batches), [dpi] * len(batches))
+                   for path in paths]
+    # Report in the caller's scenario order
+    position = {stem: i for i, stem in enumerate(stems)}
+    return sorted(written, key=lambda p: (position[os.path.splitext(os.path.basename(p))[0]],
+                                          formats.index(os.path.splitext(p)[1][1:])))
@@ -0,0 +1,136 @@
+# charts.py — the toolbox's report charts, drawn onto a caller-supplied Axes
+
+import os
+import re
+import numpy as np
+
+# Set to a directory to make the CLIs save their charts there instead of
+# opening a window (headless runs, cron jobs).
+EXPORT_DIR_ENV = "NUCLEAR_TOOLBOX_EXPORT_DIR"
+EXPORT_FORMATS = ("png", "svg", "pdf")
+
+
+def draw_decay(ax, N0, half_life, t=None):
+    """Remaining quantity over time (years) for one half-life."""
+    from decay_math.decay_formulas import decay_constant, remaining_quantity
+
+    end = t if t is not None and t > 5 else half_life * 5
+    times = np.linspace(0, end, 200)
+    ax.plot(times, remaining_quantity(N0, decay_constant(half_life), times), label=f"T½ = {half_life} yr")
+    ax.set_title("Radioactive Decay Over Time")
+    ax.set_xlabel("Time (years)")
+    ax.set_ylabel("Remaining (N)")
+    ax.grid(True, linestyle="--", alpha=0.6)
+    ax.legend()
+
+
+def draw_annual_dose(ax, daily_mSv):
+    """Cumulative dose over one year at a constant daily dose."""
+    from exposure_risk.exposure_calc import OCCUPATIONAL_LIMIT_mSv, PUBLIC_LIMIT_mSv
+
+    days = np.arange(1, 366)
+    cumulative_dose = daily_mSv * days
+    ax.plot(days, cumulative_dose, label="Cumulative Dose (mSv)", color="red")
+    ax.axhline(PUBLIC_LIMIT_mSv, color="green", linestyle="--", label=f"Public Limit ({PUBLIC_LIMIT_mSv} mSv)")
+    ax.axhline(OCCUPATIONAL_LIMIT_mSv, color="orange", linestyle="--",
+               label=f"Occupational Limit ({OCCUPATIONAL_LIMIT_mSv} mSv)")
+    ax.set_xlabel("Day of Year")
+    ax.set_ylabel("Total Dose (mSv)")
+    ax.set_title("Radiation Dose Accumulation Over 1 Year")
+    ax.set_ylim(0, max(1.2 * OCCUPATIONAL_LIMIT_mSv, cumulative_dose[-1] + 0.5))
+    ax.grid(True, linestyle="--", alpha=0.4)
+    ax.legend()
+
+
+def draw_worker_comparison(ax, a_dose, b_dose):
+    """Cumulative dose of two workers from their annual doses (mSv)."""
+    from exposure_risk.exposure_calc import OCCUPATIONAL_LIMIT_mSv, PUBLIC_LIMIT_mSv
+
+    days = np.arange(1, 366)
+    ax.plot(days, a_dose / 365 * days, label="Worker A", color="blue")
+    ax.plot(days, b_dose / 365 * days, label="Worker B", color="purple")
+    ax.axhline(PUBLIC_LIMIT_mSv, color="green", linestyle="--", label=f"Public Limit ({PUBLIC_LIMIT_mSv} mSv)")
+    ax.axhline(OCCUPATIONAL_LIMIT_mSv, color="orange", linestyle="--",
+               label=f"Worker Limit ({OCCUPATIONAL_LIMIT_mSv} mSv)")
+    ax.set_xlabel("Day of Year")
+    ax.set_ylabel("Cumulative Dose (mSv)")
+    ax.set_title("Dose Comparison: Worker A vs. B")
+    ax.set_ylim(0, max(1.2 * OCCUPATIONAL_LIMIT_mSv, 1.05 * max(a_dose, b_dose)))
+    ax.grid(True, linestyle="--", alpha=0.4)
+    ax.legend()
+
+
+def draw_emergency_dose(ax, dose):
+    """Single emergency dose (mSv) against the public and worker limits."""
+    from exposure_risk.exposure_calc import OCCUPATIONAL_LIMIT_mSv, PUBLIC_LIMIT_mSv
+
+    ax.bar(["Emergency Dose"], [dose], color="red")
+    ax.axhline(PUBLIC_LIMIT_mSv, color="green", linestyle="--", label=f"Public Limit ({PUBLIC_LIMIT_mSv} mSv)")
+    ax.axhline(OCCUPATIONAL_LIMIT_mSv, color="orange", linestyle="--",
+               label=f"Worker Limit ({OCCUPATIONAL_LIMIT_mSv} mSv)")
+    ax.set_ylabel("Dose (mSv)")
+    ax.set_title("Emergency Radiation Exposure")
+    ax.set_ylim(0, max(1.2 * OCCUPATIONAL_LIMIT_mSv, dose + 1))
+    ax.legend()
+
+
+def draw_exposure_levels(ax, levels=None):
+    """Log-scale bar chart of reference exposures (mSv), exposure_levels by default."""
+    from exposure_risk.dose_plot import exposure_levels
+
+    levels = exposure_levels if levels is None else levels
+    activities, doses = list(levels), list(levels.values())
+    bars = ax.barh(activities, doses, color='tomato')
+    ax.set_xlabel("Dose (mSv)")
+    ax.set_title("Radiation Exposure Levels from Various Sources")
+    ax.set_xscale('log')
+    ax.grid(True, which='both', linestyle='--', linewidth=0.5)
+    for bar, dose in zip(bars, doses):
+        ax.text(dose * 1.05, bar.get_y() + bar.get_height() / 2, f"{dose} mSv", va='center')
+
+
+# name → (draw function, figure size in inches)
+charts = {
+    "decay": (draw_decay, (6.4, 4.8)),
+    "annual_dose": (draw_annual_dose, (9, 4)),
+    "worker_comparison": (draw_worker_comparison, (9, 4)),
+    "emergency_dose": (draw_emergency_dose, (6, 3)),
+    "exposure_levels": (draw_exposure_levels, (10, 6)),
+}
+
+
+def chart_filename(name):
+    """A filesystem-safe file stem for a chart name."""
+    return re.sub(r"[^\w.-]+", "_", str(name)).strip("_") or "chart"
+
+
+def show_chart(chart, **params):
+    """
+    Draws a chart for an interactive CLI. When NUCLEAR_TOOLBOX_EXPORT_DIR is
+    set it is saved there as PNG instead (with an increasing number, so
+    repeated runs do not overwrite each other) and no window is opened.
+    Returns the saved path, or None when the chart was shown.
+    """
+    draw, figsize = charts[chart]
+    export_dir = os.environ.get(EXPORT_DIR_ENV)
+    if export_dir:
+        from matplotlib.figure import Figure
+
+        os.makedirs(export_dir, exist_ok=True)
+        fig = Figure(figsize=figsize)
+        draw(fig.subplots(), **params)
+        fig.tight_layout()
+        number = 1
+        while os.path.exists(path := os.path.join(export_dir, f"{chart}_{number:03d}.png")):
+            number += 1
+        fig.savefig(path)
+        return path
+
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=figsize)
+    draw(ax, **params)
+    fig.tight_layout()
+    plt.show()
+    plt.close(fig)
+    return None
@@ -0,0 +1,124 @@
+# diagram_cache.py — content-addressed cache of laid-out graphviz diagrams
+
+import hashlib
+import os
+import tempfile
+import threading
+from utils.lru import LRUCache
+
+DIAGRAM_CACHE_SIZE = 256  # SVGs kept in memory per process; a few kB each
+# Set to a directory to keep rendered SVGs across restarts and processes
+DIAGRAM_CACHE_DIR_ENV = "NUCLEAR_TOOLBOX_DIAGRAM_CACHE"
+
+
+def diagram_key(source, engine="dot"):
+    """SHA-256 of the layout engine and DOT source; identical diagrams share a key."""
+    return hashlib.sha256(f"{engine}\n{source}".encode("utf-8")).hexdigest()
+
+
+class DiagramCache:
+    """
+    SVG renders of DOT sources, looked up by diagram_key. A bounded LRU in
+    memory is shared by every session in the process. Behind it sits an
+    optional directory of <key>.svg files that survives restarts. Layout
+    runs only when both miss.
+
+    Example:
+    cache = DiagramCache(directory="/var/cache/toolbox")
+    svg = cache.svg(graph.source)
+    cache.stats()["hit_rate"]
+    """
+
+    def __init__(self, maxsize=DIAGRAM_CACHE_SIZE, directory=None):
+        self.memory = LRUCache(maxsize=maxsize)
+        self.directory = directory
+        self.disk_hits = 0
+        self.layouts = 0
+        self.layout_missing = False  # set once Graphviz turns out not to be installed
+        self._lock = threading.Lock()
+
+    def svg(self, source, engine="dot"):
+        """
+        SVG text for a DOT source. Raises graphviz.ExecutableNotFound when
+        a layout is needed and Graphviz is not installed.
+        """
+        key = diagram_key(source, engine)
+        return self.memory.get(key, lambda: self._load_or_layout(key, source, engine))
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.svg")
+
+    def _load_or_layout(self, key, source, engine):
+        if self.directory:
+            try:
+                with open(self._path(key), encoding="utf-8") as f:
+                    svg = f.read()
+                with self._lock:
+                    self.disk_hits += 1
+                return svg
+            except OSError:
+                pass
+
+        import graphviz
+
+        svg = graphviz.Source(source, engine=engine).pipe(format="svg", encoding="utf-8")
+        with self._lock:
+            self.layouts += 1
+        if self.directory:
+            self._store(key, svg)
+        return svg
+
+    def _store(self, key, svg):
+        # Write-then-rename, so other processes never read a partial file;
+        # the disk tier is best effort and a failed write only costs a layout later
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(svg)
+            os.replace(temp, self._path(key))
+        except OSError:
+            pass
+
+    def stats(self):
+        """
+        Memory-tier counters (hits, misses, evictions, size, maxsize,
+        hit_rate), plus disk_hits, layouts, layout_missing and the share of
+        lookups served without a layout.
+        """
+        stats = self.memory.stats()
+        with self._lock:
+            stats.update(disk_hits=self.disk_hits, layouts=self.layouts, directory=self.directory,
+                         layout_missing=self.layout_missing)
+        lookups = stats["hits"] + stats["misses"]
+        stats["served_from_cache"] = (stats["hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """Empties the memory tier and resets the counters; files on disk are kept."""
+        self.memory.clear()
+        with self._lock:
+            self.disk_hits = self.layouts = 0
+
+
+diagram_cache = DiagramCache(directory=os.environ.get(DIAGRAM_CACHE_DIR_ENV) or None)
+
+
+def show_diagram(graph, engine="dot", cache=diagram_cache):
+    """
+    Displays a graphviz.Digraph or DOT source in Streamlit from the render
+    cache. Without a Graphviz install, it falls back to st.graphviz_chart,
+    which lays the diagram out in the browser; the missing install is
+    remembered, so later reruns skip the cache instead of counting misses.
+    """
+    import graphviz
+    import streamlit as st
+
+    source = getattr(graph, "source", graph)
+    if not cache.layout_missing:
+        try:
+            st.image(cache.svg(source, engine))
+            return
+        except graphviz.ExecutableNotFound:
+            cache.layout_missing = True
+    st.graphviz_chart(source)
@@ -0,0 +1,111 @@
+# decay_chains.py — parent/daughter links for the isotope table, one DecayChain per decay series
+
+import math
+import numpy as np
+from decay_math.decay_chain import bateman_activity, chain_members, decay_series
+from isotopes_database.isotope_table import _format_half_life, isotope_table
+
+# Node fill for the chain graph: hue fixed, saturation from the activity decade
+_ACTIVITY_DECADES = 12
+
+
+class DecayChain:
+    """
+    One decay series as adjacency arrays over its members, which are stored
+    in topological order (parents before daughters).
+
+    Edges are sorted by parent, CSR-style: the daughters of member i are
+    daughter[offsets[i]:offsets[i + 1]] with ratios in branching. `rows`
+    links every member to its isotope table row (-1 when the table does not
+    list it), so chain members can be looked up like search results.
+
+    Example:
+    chain = decay_chains["U-238"]
+    chain.daughters("Bi-214")   # {"Po-214": 0.99979, "Tl-210": 0.00021}
+    """
+
+    __slots__ = ("root", "members", "half_life_s", "decay_constant", "parent", "daughter", "branching",
+                 "offsets", "rows", "_index", "_series")
+
+    def __init__(self, series, root):
+        self.root = root
+        self.members = tuple(chain_members(series, root))
+        self._series = series
+        self._index = {name: i for i, name in enumerate(self.members)}
+        self.half_life_s = np.array([series[name]["half_life"] for name in self.members], dtype=float)
+        self.decay_constant = math.log(2) / self.half_life_s  # 1/s, 0 for stable
+        edges = [(i, self._index[d], ratio) for i, name in enumerate(self.members)
+                 for d, ratio in series[name]["daughters"].items()]
+        self.parent = np.array([e[0] for e in edges], dtype=np.intp)
+        self.daughter = np.array([e[1] for e in edges], dtype=np.intp)
+        self.branching = np.array([e[2] for e in edges], dtype=float)
+        self.offsets = np.searchsorted(self.parent, np.arange(len(self.members) + 1))
+        self.rows = np.array([isotope_table.row(name) if name in isotope_table else -1 for name in self.members],
+                             dtype=np.intp)
+
+    def __len__(self):
+        return len(self.members)
+
+    def __contains__(self, symbol):
+        return symbol in self._index
+
+    def index(self, symbol):
+        """Position of a member in topological order; raises KeyError if it is not in the chain."""
+        try:
+            return self._index[symbol]
+        except KeyError:
+            raise KeyError(f"Isotope '{symbol}' is not in the {self.root} chain.") from None
+
+    def daughters(self, symbol):
+        """{daughter: branching ratio} of a member."""
+        i = self.index(symbol)
+        edges = slice(self.offsets[i], self.offsets[i + 1])
+        return {self.members[d]: float(r) for d, r in zip(self.daughter[edges], self.branching[edges])}
+
+    def parents(self, symbol):
+        """{parent: branching ratio} of a member."""
+        edges = np.flatnonzero(self.daughter == self.index(symbol))
+        return {self.members[self.parent[e]]: float(self.branching[e]) for e in edges}
+
+    def activity(self, times, initial=None):
+        """
+        Activity of every member (decays per second per initial atom) at
+        `times` in seconds, shape (len(members), *times.shape). The chain
+        starts as pure root unless `initial` ({member: atoms}) is given.
+        """
+        _, A = bateman_activity(self._series, initial or self.root, times, members=list(self.members))
+        return A
+
+    def dot_source(self, activity=None):
+        """
+        Graphviz DOT source of the chain, one node per member with its
+        half-life, edges labelled with branching ratios below 1. When
+        `activity` (one value per member, relative to the root) is given,
+        nodes are shaded by its decade and labelled with it.
+        """
+        lines = [f'digraph "{self.root} series" {{', "  rankdir=TB;",
+                 '  node [shape=box, style="rounded,filled", fontname="Helvetica", fillcolor="white"];']
+        for i, name in enumerate(self.members):
+            label = f"{name}\\n{_format_half_life(self.half_life_s[i])}"
+            attributes = ""
+            if activity is not None:
+                if activity[i] > 0:
+                    level = np.clip(1 + math.log10(activity[i]) / _ACTIVITY_DECADES, 0.05, 1.0)
+                    label += f"\\nA/A₀ = {activity[i]:.2e}"
+                    attributes = f', fillcolor="0.08 {level:.3f} 1.000"'
+                else:
+                    label += "\\nA/A₀ = 0"
+            lines.append(f'  "{name}" [label="{label}"{attributes}];')
+        for p, d, ratio in zip(self.parent, self.daughter, self.branching):
+            label = f' [label="{ratio * 100:.4g}%"]' if ratio < 1 else ""
+            lines.append(f'  "{self.members[p]}" -> "{self.members[d]}"{label};')
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+
+def series_containing(symbol):
+    """Roots of the decay series that pass through an isotope."""
+    return [root for root, chain in decay_chains.items() if symbol in chain]
+
+
+decay_chains = {root: DecayChain(series, root) for root, series in decay_series.items()}
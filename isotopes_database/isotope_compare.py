@@ -1,33 +1,28 @@
 import streamlit as st
-from isotopes_database.isotope_database import isotope_data
+from isotopes_database.isotope_table import isotope_table
 import pandas as pd
 
 def compare_isotopes():
     st.header("⚖️ Compare Isotopes")
 
     # Sort for better UX
-    isotope_names = sorted([f"{i['symbol']} ({i['name']})" for i in isotope_data])
+    isotope_names = sorted(f"{sym} ({name})" for sym, name in zip(isotope_table.symbol, isotope_table.name))
 
     selected = st.multiselect("Select isotopes to compare:", isotope_names, max_selections=5)
 
     if selected:
-        # Map back to data
-        filtered = []
-        for choice in selected:
-            sym = choice.split(" ")[0]
-            match = next((iso for iso in isotope_data if iso['symbol'] == sym), None)
-            if match:
-                filtered.append(match)
-
-        df = pd.DataFrame(filtered)
+        # Map back to table rows
+        rows = isotope_table.rows([choice.split(" ")[0] for choice in selected])
+
+        df = pd.DataFrame([isotope_table.record(i) for i in rows])
         st.subheader("🔬 Isotope Comparison Table")
         st.dataframe(df.set_index("symbol"), use_container_width=True)
 
         # Optional chart
         st.subheader("📊 Decay Energy Comparison")
         chart_data = pd.DataFrame({
-            "Isotope": [f"{i['symbol']}" for i in filtered],
-            "Decay Energy (MeV)": [float(i['energy'].split()[0]) for i in filtered],
+            "Isotope": isotope_table.symbol[rows],
+            "Decay Energy (MeV)": isotope_table.energy_MeV[rows],
         })
         st.bar_chart(chart_data.set_index("Isotope"))
 
@@ -0,0 +1,160 @@
+# isotope_index.py — prebuilt search index over an IsotopeTable
+
+import bisect
+import fnmatch
+import re
+import numpy as np
+from isotopes_database.isotope_table import isotope_table
+
+# Rank of a match; lower ranks are listed first
+EXACT = 0
+KEY_FIELD = 1
+PREFIX = 2
+SUBSTRING = 3
+
+_NGRAM = 3
+_filter_pattern = re.compile(r"([za])\s*[=:]\s*(\d+)")
+
+
+class IsotopeIndex:
+    """
+    Search index over the keys of an IsotopeTable: the symbol ("cs-137"),
+    its compact form ("cs137") and the name ("cesium-137").
+
+    - n-gram postings (n = 1..3) answer substring queries by intersection
+    - a sorted key list answers prefix queries by binary search
+    - element symbol, Z and A maps answer field queries ("cs", "z=55", "a=137")
+    - "*" and "?" wildcards ("Cs-13*") are matched against candidate keys
+
+    Example:
+    index = IsotopeIndex(isotope_table)
+    rows, total = index.search("cs-13*", page=0, per_page=20)
+    """
+
+    def __init__(self, table):
+        self.table = table
+        keys, key_rows = [], []
+        for row, (symbol, name) in enumerate(zip(table.symbol.tolist(), table.name.tolist())):
+            symbol, name = symbol.lower(), name.lower()
+            for key in dict.fromkeys((symbol, symbol.replace("-", ""), name)):
+                keys.append(key)
+                key_rows.append(row)
+        self._keys = np.array(keys, dtype=str)
+        self._key_rows = np.array(key_rows, dtype=np.intp)
+
+        order = np.argsort(self._keys, kind="stable")
+        self._sorted_keys = self._keys[order].tolist()
+        self._sorted_rows = self._key_rows[order]
+
+        exact = {}
+        postings = {}
+        for key_id, key in enumerate(keys):
+            exact.setdefault(key, []).append(key_rows[key_id])
+            for n in range(1, _NGRAM + 1):
+                for start in range(len(key) - n + 1):
+                    postings.setdefault(key[start:start + n], set()).add(key_id)
+        # n-gram -> sorted key ids containing it
+        self._postings = {gram: np.array(sorted(ids), dtype=np.intp) for gram, ids in postings.items()}
+        self._exact = {key: np.unique(rows) for key, rows in exact.items()}
+
+        self._by_element = _group_rows(np.char.lower(table.element))
+        self._by_Z = _group_rows(table.Z)
+        self._by_A = _group_rows(table.A)
+        # Secondary ordering of results: by Z, then A, then isomer level
+        self._natural_rank = np.empty(len(table), dtype=np.intp)
+        self._natural_rank[np.lexsort((table.isomer, table.A, table.Z))] = np.arange(len(table))
+
+    def __len__(self):
+        return len(self.table)
+
+    def _prefix_rows(self, prefix):
+        lo = bisect.bisect_left(self._sorted_keys, prefix)
+        hi = bisect.bisect_left(self._sorted_keys, prefix + "\uffff")
+        return np.unique(self._sorted_rows[lo:hi])
+
+    def _substring_keys(self, text):
+        """Ids of the keys containing text."""
+        if len(text) <= _NGRAM:
+            return self._postings.get(text, np.empty(0, dtype=np.intp))
+        grams = {text[i:i + _NGRAM] for i in range(len(text) - _NGRAM + 1)}
+        lists = sorted((self._postings.get(g, np.empty(0, dtype=np.intp)) for g in grams), key=len)
+        candidates = lists[0]
+        for ids in lists[1:]:
+            if not candidates.size:
+                break
+            candidates = np.intersect1d(candidates, ids, assume_unique=True)
+        # Shared n-grams are necessary but not sufficient; confirm the substring
+        return candidates[np.char.find(self._keys[candidates], text) >= 0]
+
+    def _substring_rows(self, text):
+        return np.unique(self._key_rows[self._substring_keys(text)])
+
+    def _wildcard_rows(self, pattern):
+        literal_prefix = re.split(r"[*?\[]", pattern, maxsplit=1)[0]
+        fragments = [f for f in re.split(r"[*?\[\]]", pattern) if f]
+        if literal_prefix:
+            lo = bisect.bisect_left(self._sorted_keys, literal_prefix)
+            hi = bisect.bisect_left(self._sorted_keys, literal_prefix + "\uffff")
+            keys, rows = self._sorted_keys[lo:hi], self._sorted_rows[lo:hi]
+        else:
+            ids = self._substring_keys(max(fragments, key=len)) if fragments else np.arange(self._keys.size)
+            keys, rows = self._keys[ids].tolist(), self._key_rows[ids]
+        match = re.compile(fnmatch.translate(pattern)).match
+        hits = np.fromiter((match(k) is not None for k in keys), dtype=bool, count=len(keys))
+        return np.unique(rows[hits])
+
+    def match(self, query):
+        """Returns (rows, ranks) of every row matching the query, unordered."""
+        query = query.strip().lower()
+        filters = _filter_pattern.findall(query)
+        text = _filter_pattern.sub(" ", query).strip()
+
+        if text and any(c in text for c in "*?["):
+            rows = self._wildcard_rows(text)
+            ranks = np.full(rows.size, PREFIX)
+        elif text:
+            rows = self._substring_rows(text)
+            ranks = np.full(rows.size, SUBSTRING)
+            ranks[np.isin(rows, self._prefix_rows(text))] = PREFIX
+            field_rows = [self._by_element.get(text)]
+            if text.isdigit():
+                field_rows.append(self._by_A.get(int(text)))
+            for field in field_rows:
+                if field is not None:
+                    ranks[np.isin(rows, field)] = KEY_FIELD
+            exact = self._exact.get(text)
+            if exact is not None:
+                ranks[np.isin(rows, exact)] = EXACT
+        else:
+            rows = np.arange(len(self.table))
+            ranks = np.full(rows.size, KEY_FIELD)
+
+        for field, value in filters:
+            lookup = self._by_Z if field == "z" else self._by_A
+            keep = np.isin(rows, lookup.get(int(value), np.empty(0, dtype=np.intp)))
+            rows, ranks = rows[keep], ranks[keep]
+        return rows, ranks
+
+    def ranked(self, query):
+        """Table row indices of every match, best first; slice it to paginate."""
+        rows, ranks = self.match(query)
+        return rows[np.lexsort((self._natural_rank[rows], ranks))]
+
+    def search(self, query, page=0, per_page=20):
+        """
+        Ranked, paginated search. Returns (rows, total) where rows holds the
+        table row indices for the requested page and total counts all matches.
+        """
+        ranked = self.ranked(query)
+        start = page * per_page
+        return ranked[start:start + per_page], ranked.size
+
+
+def _group_rows(values):
+    groups = {}
+    for row, value in enumerate(values.tolist()):
+        groups.setdefault(value, []).append(row)
+    return {value: np.array(rows, dtype=np.intp) for value, rows in groups.items()}
+
+
+isotope_index = IsotopeIndex(isotope_table)
@@ -1,16 +1,26 @@
+import math
 import streamlit as st
-from isotopes_database.isotope_database import isotope_data
+from isotopes_database.isotope_table import isotope_table
+from isotopes_database.isotope_index import isotope_index
 
 def isotope_searcher():
     st.header("🔍 Isotope Database Search")
 
-    query = st.text_input("Enter isotope name or symbol (e.g., Cs-137, Iodine)").strip().lower()
+    query = st.text_input("Enter isotope name or symbol (e.g., Cs-137, Iodine, Cs-13*, z=92)").strip()
 
     if query:
-        found = [i for i in isotope_data if query in i['name'].lower() or query in i['symbol'].lower()]
+        col1, col2 = st.columns(2)
+        per_page = col1.selectbox("Results per page", [10, 20, 50], index=1)
+        ranked = isotope_index.ranked(query)
+        total = ranked.size
+        pages = max(1, math.ceil(total / per_page))
+        page = col2.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1) - 1
+        rows = ranked[page * per_page:(page + 1) * per_page]
         
-        if found:
-            for iso in found:
+        if total:
+            st.caption(f"{total} matching isotope(s) · showing {page * per_page + 1}–{page * per_page + rows.size}")
+            for i in rows:
+                iso = isotope_table.record(i)
                 st.markdown(f"### {iso['name']} ({iso['symbol']})")
                 st.write(f"**Half-life:** {iso['half_life']}")
                 st.write(f"**Decay Mode:** {iso['decay_mode']}")
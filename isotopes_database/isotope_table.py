@@ -0,0 +1,293 @@
+# isotope_table.py — typed, pre-parsed columns for the isotope database
+
+import math
+import os
+import re
+import numpy as np
+from decay_math.units import factor, time_units
+from isotopes_database.isotope_database import isotope_data
+
+SECONDS_PER_YEAR = factor("y", "s")
+
+# Decay-mode bit flags
+ALPHA = 1
+BETA = 2
+GAMMA = 4
+ISOMERIC_TRANSITION = 8
+ELECTRON_CAPTURE = 16
+BETA_PLUS = 32
+SPONTANEOUS_FISSION = 64
+NEUTRON = 128
+PROTON = 256
+
+decay_mode_flags = {
+    "alpha": ALPHA,
+    "beta": BETA,
+    "beta-": BETA,
+    "gamma": GAMMA,
+    "isomeric transition": ISOMERIC_TRANSITION,
+    "electron capture": ELECTRON_CAPTURE,
+    "beta+": BETA_PLUS,
+    "spontaneous fission": SPONTANEOUS_FISSION,
+    "neutron": NEUTRON,
+    "proton": PROTON,
+}
+
+element_symbols = [
+    "H", "He", "Li", "Be", "B", "C", "N", "O", "F", "Ne", "Na", "Mg", "Al", "Si", "P", "S", "Cl", "Ar",
+    "K", "Ca", "Sc", "Ti", "V", "Cr", "Mn", "Fe", "Co", "Ni", "Cu", "Zn", "Ga", "Ge", "As", "Se", "Br", "Kr",
+    "Rb", "Sr", "Y", "Zr", "Nb", "Mo", "Tc", "Ru", "Rh", "Pd", "Ag", "Cd", "In", "Sn", "Sb", "Te", "I", "Xe",
+    "Cs", "Ba", "La", "Ce", "Pr", "Nd", "Pm", "Sm", "Eu", "Gd", "Tb", "Dy", "Ho", "Er", "Tm", "Yb", "Lu",
+    "Hf", "Ta", "W", "Re", "Os", "Ir", "Pt", "Au", "Hg", "Tl", "Pb", "Bi", "Po", "At", "Rn",
+    "Fr", "Ra", "Ac", "Th", "Pa", "U", "Np", "Pu", "Am", "Cm", "Bk", "Cf", "Es", "Fm", "Md", "No", "Lr",
+    "Rf", "Db", "Sg", "Bh", "Hs", "Mt", "Ds", "Rg", "Cn", "Nh", "Fl", "Mc", "Lv", "Ts", "Og",
+]
+element_names = [
+    "Hydrogen", "Helium", "Lithium", "Beryllium", "Boron", "Carbon", "Nitrogen", "Oxygen", "Fluorine", "Neon",
+    "Sodium", "Magnesium", "Aluminium", "Silicon", "Phosphorus", "Sulfur", "Chlorine", "Argon",
+    "Potassium", "Calcium", "Scandium", "Titanium", "Vanadium", "Chromium", "Manganese", "Iron", "Cobalt",
+    "Nickel", "Copper", "Zinc", "Gallium", "Germanium", "Arsenic", "Selenium", "Bromine", "Krypton",
+    "Rubidium", "Strontium", "Yttrium", "Zirconium", "Niobium", "Molybdenum", "Technetium", "Ruthenium",
+    "Rhodium", "Palladium", "Silver", "Cadmium", "Indium", "Tin", "Antimony", "Tellurium", "Iodine", "Xenon",
+    "Cesium", "Barium", "Lanthanum", "Cerium", "Praseodymium", "Neodymium", "Promethium", "Samarium",
+    "Europium", "Gadolinium", "Terbium", "Dysprosium", "Holmium", "Erbium", "Thulium", "Ytterbium", "Lutetium",
+    "Hafnium", "Tantalum", "Tungsten", "Rhenium", "Osmium", "Iridium", "Platinum", "Gold", "Mercury",
+    "Thallium", "Lead", "Bismuth", "Polonium", "Astatine", "Radon",
+    "Francium", "Radium", "Actinium", "Thorium", "Protactinium", "Uranium", "Neptunium", "Plutonium",
+    "Americium", "Curium", "Berkelium", "Californium", "Einsteinium", "Fermium", "Mendelevium", "Nobelium",
+    "Lawrencium", "Rutherfordium", "Dubnium", "Seaborgium", "Bohrium", "Hassium", "Meitnerium",
+    "Darmstadtium", "Roentgenium", "Copernicium", "Nihonium", "Flerovium", "Moscovium", "Livermorium",
+    "Tennessine", "Oganesson",
+]
+atomic_numbers = {symbol: z for z, symbol in enumerate(element_symbols, start=1)}
+
+_time_units = {"second": time_units["s"], "minute": time_units["min"], "hour": time_units["h"],
+               "day": time_units["d"], "year": time_units["y"]}
+_multipliers = {"thousand": 1e3, "million": 1e6, "billion": 1e9, "trillion": 1e12}
+_energy_units = {unit.lower(): factor(unit, "MeV") for unit in ("eV", "keV", "MeV", "GeV")}
+
+
+def parse_half_life(text):
+    """
+    Parses a free-text half-life into seconds.
+
+    Example:
+    parse_half_life("703.8 million years") → 2.221e16
+    parse_half_life("stable") → inf
+    """
+    cleaned = text.strip().lower().replace(",", "")
+    if cleaned == "stable":
+        return math.inf
+    match = re.fullmatch(r"([0-9.eE+-]+)\s*(?:(thousand|million|billion|trillion)\s+)?([a-z]+?)s?", cleaned)
+    if not match or match.group(3) not in _time_units:
+        raise ValueError(f"Cannot parse half-life '{text}'.")
+    value, multiplier, unit = match.groups()
+    return float(value) * _multipliers.get(multiplier, 1) * _time_units[unit]
+
+
+def parse_energy(text):
+    """Parses an energy such as "4.679 MeV" or "140 keV" into MeV."""
+    value, _, unit = text.strip().partition(" ")
+    unit = unit.strip().lower() or "mev"
+    if unit not in _energy_units:
+        raise ValueError(f"Cannot parse energy '{text}'.")
+    return float(value) * _energy_units[unit]
+
+
+def parse_decay_mode(text):
+    """Converts a decay-mode description into a bit mask of the flags above."""
+    flags = 0
+    for part in re.split(r"[,()/]", text.lower()):
+        part = part.strip()
+        if part:
+            flags |= decay_mode_flags.get(part, 0)
+    return flags
+
+
+def parse_symbol(symbol):
+    """Splits "Tc-99m" into ("Tc", 43, 99, 1): element, Z, A and isomer level."""
+    match = re.fullmatch(r"([A-Z][a-z]?)-(\d+)(m\d?)?", symbol.strip())
+    if not match:
+        raise ValueError(f"Cannot parse isotope symbol '{symbol}'.")
+    element, mass, isomer = match.groups()
+    if element not in atomic_numbers:
+        raise ValueError(f"Unknown element '{element}'.")
+    level = 0 if not isomer else int(isomer[1:] or 1)
+    return element, atomic_numbers[element], int(mass), level
+
+
+class Nuclide:
+    """One row of an IsotopeTable as typed fields."""
+
+    __slots__ = ("name", "symbol", "element", "Z", "A", "isomer",
+                 "half_life_s", "decay_constant", "energy_MeV", "decay_flags")
+
+    def __init__(self, name, symbol, element, Z, A, isomer, half_life_s, decay_constant, energy_MeV, decay_flags):
+        self.name = name
+        self.symbol = symbol
+        self.element = element
+        self.Z = Z
+        self.A = A
+        self.isomer = isomer
+        self.half_life_s = half_life_s
+        self.decay_constant = decay_constant
+        self.energy_MeV = energy_MeV
+        self.decay_flags = decay_flags
+
+    def __repr__(self):
+        return f"Nuclide({self.symbol!r}, half_life_s={self.half_life_s:.4g}, energy_MeV={self.energy_MeV})"
+
+    def has_mode(self, flag):
+        return bool(self.decay_flags & flag)
+
+
+class IsotopeTable:
+    """
+    Column-oriented isotope table. Every column is a NumPy array of the same
+    length, parsed once when the table is built, so callers can filter and
+    compute on whole columns instead of re-parsing record strings.
+    """
+
+    __slots__ = ("name", "symbol", "element", "Z", "A", "isomer",
+                 "half_life_s", "decay_constant", "energy_MeV", "decay_flags",
+                 "half_life_text", "decay_mode_text", "_rows")
+
+    def __init__(self, name, symbol, element, Z, A, isomer, half_life_s, energy_MeV, decay_flags,
+                 half_life_text=None, decay_mode_text=None):
+        self.name = np.asarray(name, dtype=str)
+        self.symbol = np.asarray(symbol, dtype=str)
+        self.element = np.asarray(element, dtype=str)
+        self.Z = np.asarray(Z, dtype=np.int16)
+        self.A = np.asarray(A, dtype=np.int16)
+        self.isomer = np.asarray(isomer, dtype=np.int8)
+        self.half_life_s = np.asarray(half_life_s, dtype=np.float64)
+        self.decay_constant = math.log(2) / self.half_life_s  # 1/s, 0 for stable
+        self.energy_MeV = np.asarray(energy_MeV, dtype=np.float64)
+        self.decay_flags = np.asarray(decay_flags, dtype=np.uint16)
+        self.half_life_text = np.asarray(half_life_text if half_life_text is not None
+                                         else [_format_half_life(s) for s in self.half_life_s], dtype=str)
+        self.decay_mode_text = np.asarray(decay_mode_text if decay_mode_text is not None
+                                          else [_format_decay_mode(f) for f in self.decay_flags], dtype=str)
+        self._rows = {sym: i for i, sym in enumerate(self.symbol.tolist())}
+
+    @classmethod
+    def from_records(cls, records):
+        """Builds a table from dicts shaped like isotope_database.isotope_data."""
+        parsed = [parse_symbol(r["symbol"]) for r in records]
+        return cls(
+            name=[r["name"] for r in records],
+            symbol=[r["symbol"] for r in records],
+            element=[p[0] for p in parsed],
+            Z=[p[1] for p in parsed],
+            A=[p[2] for p in parsed],
+            isomer=[p[3] for p in parsed],
+            half_life_s=[parse_half_life(r["half_life"]) for r in records],
+            energy_MeV=[parse_energy(r["energy"]) for r in records],
+            decay_flags=[parse_decay_mode(r["decay_mode"]) for r in records],
+            half_life_text=[r["half_life"] for r in records],
+            decay_mode_text=[r["decay_mode"] for r in records],
+        )
+
+    def columns(self):
+        """The stored columns as keyword arguments for IsotopeTable(...)."""
+        return {
+            "name": self.name,
+            "symbol": self.symbol,
+            "element": self.element,
+            "Z": self.Z,
+            "A": self.A,
+            "isomer": self.isomer,
+            "half_life_s": self.half_life_s,
+            "energy_MeV": self.energy_MeV,
+            "decay_flags": self.decay_flags,
+            "half_life_text": self.half_life_text,
+            "decay_mode_text": self.decay_mode_text,
+        }
+
+    def merged(self, other):
+        """
+        Returns a new table with the rows of other appended. Rows of this
+        table win when both contain the same symbol.
+        """
+        keep = ~np.isin(other.symbol, self.symbol)
+        mine, theirs = self.columns(), other.columns()
+        return IsotopeTable(**{key: np.concatenate([mine[key], theirs[key][keep]]) for key in mine})
+
+    def __len__(self):
+        return self.symbol.size
+
+    def row(self, symbol):
+        """Row index of an isotope symbol; raises KeyError if it is unknown."""
+        try:
+            return self._rows[symbol]
+        except KeyError:
+            raise KeyError(f"Isotope '{symbol}' is not in the table.") from None
+
+    def rows(self, symbols):
+        return np.array([self.row(s) for s in symbols], dtype=np.intp)
+
+    def __contains__(self, symbol):
+        return symbol in self._rows
+
+    def nuclide(self, key):
+        """Returns a Nuclide for a row index or symbol."""
+        i = self.row(key) if isinstance(key, str) else int(key)
+        return Nuclide(str(self.name[i]), str(self.symbol[i]), str(self.element[i]), int(self.Z[i]),
+                       int(self.A[i]), int(self.isomer[i]), float(self.half_life_s[i]),
+                       float(self.decay_constant[i]), float(self.energy_MeV[i]), int(self.decay_flags[i]))
+
+    def record(self, i):
+        """Display record for row i, with both the source text and parsed values."""
+        return {
+            "name": str(self.name[i]),
+            "symbol": str(self.symbol[i]),
+            "half_life": str(self.half_life_text[i]),
+            "half_life_s": float(self.half_life_s[i]),
+            "decay_constant": float(self.decay_constant[i]),
+            "decay_mode": str(self.decay_mode_text[i]),
+            "energy": f"{self.energy_MeV[i]:g} MeV" if not np.isnan(self.energy_MeV[i]) else "unknown",
+            "energy_MeV": float(self.energy_MeV[i]),
+        }
+
+    def with_mode(self, flag):
+        """Boolean mask of rows whose decay modes include the given flag(s)."""
+        return (self.decay_flags & flag) != 0
+
+
+def _format_half_life(seconds):
+    if math.isinf(seconds):
+        return "stable"
+    for unit, size in (("years", _time_units["year"]), ("days", _time_units["day"]), ("hours", _time_units["hour"]),
+                       ("minutes", _time_units["minute"])):
+        if seconds >= size:
+            return f"{seconds / size:.4g} {unit}"
+    return f"{seconds:.4g} seconds"
+
+
+def _format_decay_mode(flags):
+    names = {ALPHA: "Alpha", BETA: "Beta", GAMMA: "Gamma", ISOMERIC_TRANSITION: "Isomeric transition",
+             ELECTRON_CAPTURE: "Electron capture", BETA_PLUS: "Beta+", SPONTANEOUS_FISSION: "Spontaneous fission",
+             NEUTRON: "Neutron", PROTON: "Proton"}
+    return ", ".join(name for flag, name in names.items() if flags & flag) or "Stable"
+
+
+def _default_table():
+    """
+    The curated records, extended with a NUBASE file when the
+    NUCLEAR_TOOLBOX_NUBASE environment variable points to one.
+    """
+    table = IsotopeTable.from_records(isotope_data)
+    source = os.environ.get("NUCLEAR_TOOLBOX_NUBASE")
+    if source:
+        from isotopes_database.nubase_import import load_nubase
+        table = table.merged(load_nubase(source))
+    return table
+
+
+def __getattr__(name):
+    # isotope_table is built on first access rather than at import, so the
+    # NUBASE importer can itself import this module without a cycle.
+    if name == "isotope_table":
+        table = globals()["isotope_table"] = _default_table()
+        return table
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
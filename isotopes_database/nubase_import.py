@@ -0,0 +1,192 @@
+# nubase_import.py — streaming NUBASE parser with a memory-mapped binary cache
+
+import hashlib
+import json
+import math
+import os
+import re
+import shutil
+import tempfile
+import numpy as np
+from isotopes_database.isotope_table import (
+    IsotopeTable, SECONDS_PER_YEAR, ALPHA, BETA, BETA_PLUS, ELECTRON_CAPTURE, ISOMERIC_TRANSITION,
+    SPONTANEOUS_FISSION, NEUTRON, PROTON, element_names, element_symbols,
+)
+
+# Bump when the parser or the cached column layout changes
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "nuclear_toolbox")
+
+# NUBASE2020 half-life units, in seconds
+_nubase_units = {
+    "ys": 1e-24, "zs": 1e-21, "as": 1e-18, "fs": 1e-15, "ps": 1e-12, "ns": 1e-9, "us": 1e-6, "ms": 1e-3,
+    "s": 1, "m": 60, "h": 3600, "d": 24 * 3600, "y": SECONDS_PER_YEAR,
+    "ky": 1e3 * SECONDS_PER_YEAR, "My": 1e6 * SECONDS_PER_YEAR, "Gy": 1e9 * SECONDS_PER_YEAR,
+    "Ty": 1e12 * SECONDS_PER_YEAR, "Py": 1e15 * SECONDS_PER_YEAR, "Ey": 1e18 * SECONDS_PER_YEAR,
+    "Zy": 1e21 * SECONDS_PER_YEAR, "Yy": 1e24 * SECONDS_PER_YEAR,
+}
+_nubase_modes = {
+    "A": ALPHA, "B-": BETA, "B+": BETA_PLUS, "e+": BETA_PLUS, "EC": ELECTRON_CAPTURE,
+    "IT": ISOMERIC_TRANSITION, "SF": SPONTANEOUS_FISSION, "n": NEUTRON, "p": PROTON,
+}
+_mode_pattern = re.compile(r"B-|B\+|e\+|EC|IT|SF|A|n|p")
+_isomer_suffix = {0: "", 1: "m", 2: "m2"}
+
+
+def _nubase_half_life(value, unit):
+    """Half-life in seconds from the value and unit fields; None if unknown."""
+    value = value.strip()
+    if value.startswith("stbl"):
+        return math.inf
+    try:
+        return float(value.strip("#<>~ ")) * _nubase_units[unit.strip()]
+    except (ValueError, KeyError):
+        return None
+
+
+def _nubase_decay_flags(text):
+    flags = 0
+    for part in text.split(";"):
+        code = re.split(r"[=~<>? ]", part.strip(), maxsplit=1)[0]
+        if code.startswith("IS"):  # isotopic abundance, not a decay mode
+            continue
+        for mode in _mode_pattern.findall(code):
+            flags |= _nubase_modes[mode]
+    return flags
+
+
+def iter_nubase(path):
+    """
+    Streams the ground states and first two isomers of a NUBASE2020-style
+    fixed-width file as tuples
+    (name, symbol, element, Z, A, isomer, half_life_s, decay_flags).
+
+    Comment lines ("#"), excited levels above the second isomer, the free
+    neutron and entries without a measured or estimated half-life are skipped.
+    """
+    with open(path, encoding="ascii", errors="replace") as lines:
+        for line in lines:
+            if line.startswith("#") or len(line) < 80:
+                continue
+            try:
+                A = int(line[0:3])
+                Z, isomer = divmod(int(line[4:8]), 10)
+            except ValueError:
+                continue
+            if not 1 <= Z <= len(element_symbols) or isomer > 2:
+                continue
+            half_life = _nubase_half_life(line[69:78], line[78:80])
+            if half_life is None:
+                continue
+            suffix = _isomer_suffix[isomer]
+            element = element_symbols[Z - 1]
+            yield (f"{element_names[Z - 1]}-{A}{suffix}", f"{element}-{A}{suffix}", element,
+                   Z, A, isomer, half_life, _nubase_decay_flags(line[119:]))
+
+
+def parse_nubase(path):
+    """Parses a NUBASE file into an IsotopeTable (no caching)."""
+    rows = list(iter_nubase(path))
+    columns = list(zip(*rows)) if rows else [[]] * 8
+    name, symbol, element, Z, A, isomer, half_life_s, decay_flags = columns
+    return IsotopeTable(name, symbol, element, Z, A, isomer, half_life_s,
+                        energy_MeV=np.full(len(rows), np.nan), decay_flags=decay_flags)
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for block in iter(lambda: source.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _cache_prefix(path):
+    """
+    Name prefix shared by every cached version of one source file: its stem
+    plus a hash of its absolute path, so same-named files elsewhere do not
+    share or prune each other's caches.
+    """
+    stem = os.path.splitext(os.path.basename(path))[0]
+    source = hashlib.sha256(os.path.abspath(path).encode("utf-8")).hexdigest()[:12]
+    return f"{stem}-{source}-v"
+
+
+def _cache_path(cache_dir, path, sha256):
+    return os.path.join(cache_dir, f"{_cache_prefix(path)}{CACHE_VERSION}-{sha256[:16]}")
+
+
+def _write_cache(table, target, meta):
+    """Writes every column as .npy next to meta.json, then moves the directory into place."""
+    parent = os.path.dirname(target)
+    os.makedirs(parent, exist_ok=True)
+    staging = tempfile.mkdtemp(dir=parent, prefix=".staging-")
+    try:
+        for key, column in table.columns().items():
+            np.save(os.path.join(staging, f"{key}.npy"), np.ascontiguousarray(column))
+        with open(os.path.join(staging, "meta.json"), "w") as f:
+            json.dump(meta, f)
+        os.replace(staging, target)
+    except OSError:
+        # Another process may have written the same cache first
+        shutil.rmtree(staging, ignore_errors=True)
+        if not os.path.isdir(target):
+            raise
+
+
+def _read_cache(target, sha256):
+    """Loads a cached table with memory-mapped columns, or None if it is missing, stale or damaged."""
+    try:
+        with open(os.path.join(target, "meta.json")) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get("version") != CACHE_VERSION or meta.get("sha256") != sha256:
+        return None
+    try:
+        columns = {key: np.load(os.path.join(target, f"{key}.npy"), mmap_mode="r") for key in meta["columns"]}
+    except (OSError, ValueError):
+        # A missing or truncated column; treat the cache as stale
+        return None
+    return IsotopeTable(**columns)
+
+
+def _prune_stale(cache_dir, path, keep):
+    """Removes older cached versions of this source file only."""
+    prefix = _cache_prefix(path)
+    for entry in os.listdir(cache_dir):
+        full = os.path.join(cache_dir, entry)
+        if entry.startswith(prefix) and full != keep:
+            shutil.rmtree(full, ignore_errors=True)
+
+
+def load_nubase(path, cache_dir=None):
+    """
+    Loads a NUBASE file as an IsotopeTable, parsing it only the first time.
+
+    The parsed columns are cached under cache_dir (default
+    ~/.cache/nuclear_toolbox) in a directory keyed by the source's
+    absolute path, CACHE_VERSION and the SHA-256 of its contents, so
+    editing or replacing the file invalidates the cache. Later loads
+    memory-map the .npy columns.
+
+    Example:
+    table = isotope_table.merged(load_nubase("nubase_4.mas20.txt"))
+    """
+    cache_dir = cache_dir or DEFAULT_CACHE_DIR
+    sha256 = file_sha256(path)
+    target = _cache_path(cache_dir, path, sha256)
+
+    table = _read_cache(target, sha256)
+    if table is not None:
+        return table
+
+    table = parse_nubase(path)
+    meta = {"version": CACHE_VERSION, "sha256": sha256, "source": os.path.abspath(path),
+            "rows": len(table), "columns": list(table.columns())}
+    # A damaged cache directory would block the rename in _write_cache
+    shutil.rmtree(target, ignore_errors=True)
+    _write_cache(table, target, meta)
+    _prune_stale(cache_dir, path, target)
+    cached = _read_cache(target, sha256)
+    return cached if cached is not None else table
@@ -0,0 +1,81 @@
+# core_model.py — vectorized core layout, rod lattice and power maps
+
+import numpy as np
+
+CONTROL_ROD = -1  # marker in the core map for control rod positions
+MIN_ENRICHMENT = 0.1  # %
+POWER_PER_ENRICHMENT = 10  # MWt per % enrichment per cell, scaled by k_eff
+
+
+def distance_map(grid_size, metric="chebyshev", center=None):
+    """
+    Distance of every cell from the core center, in cells.
+
+    metric — "chebyshev" gives square zones (max(|di|, |dj|)),
+             "euclidean" gives round zones.
+    """
+    if center is None:
+        center = grid_size // 2
+    i, j = np.ogrid[:grid_size, :grid_size]
+    di, dj = np.abs(i - center), np.abs(j - center)
+    if metric == "chebyshev":
+        return np.maximum(di, dj)
+    if metric == "euclidean":
+        return np.hypot(di, dj)
+    raise ValueError(f"Unknown distance metric '{metric}'.")
+
+
+def enrichment_zones(distance, base_enrichment, gradient, minimum=MIN_ENRICHMENT):
+    """Enrichment (%) falling off linearly with distance, floored at `minimum`."""
+    return np.maximum(base_enrichment - gradient * distance, minimum)
+
+
+def rod_lattice(grid_size, spacing):
+    """Boolean mask with a control rod every `spacing` cells in both directions."""
+    rods = np.zeros((grid_size, grid_size), dtype=bool)
+    if spacing:
+        rods[::spacing, ::spacing] = True
+    return rods
+
+
+def power_map(enrichment, rods, k_eff, per_enrichment=POWER_PER_ENRICHMENT):
+    """Thermal power per cell (MWt); rodded cells produce nothing."""
+    return np.where(rods, 0.0, per_enrichment * enrichment * k_eff)
+
+
+def build_core(grid_size, base_enrichment, gradient, k_eff, rod_spacing=None, metric="chebyshev"):
+    """
+    Builds a complete core model in a handful of array operations, so pin-level
+    grids (500×500 and larger) build in milliseconds.
+
+    Returns a dict with:
+    - "core": enrichment (%) per cell, CONTROL_ROD where a rod is inserted
+    - "rods": boolean rod mask
+    - "power": thermal power per cell (MWt)
+    - "total_power": summed thermal power (MWt)
+    - "mean_enrichment": mean enrichment of the fuel cells (%)
+
+    Example:
+    model = build_core(500, 3.0, 0.01, 1.05, rod_spacing=17)
+    """
+    enrichment = enrichment_zones(distance_map(grid_size, metric), base_enrichment, gradient)
+    rods = rod_lattice(grid_size, rod_spacing)
+    power = power_map(enrichment, rods, k_eff)
+    fuel = ~rods
+    return {
+        "core": np.where(rods, CONTROL_ROD, enrichment),
+        "rods": rods,
+        "power": power,
+        "total_power": float(power.sum()),
+        "mean_enrichment": float(enrichment[fuel].mean()) if fuel.any() else 0.0,
+    }
+
+
+def reactivity_map(core_radius, enrichment, control_rod_level):
+    """
+    Relative reactivity of a round core of the given radius (cells): the
+    rod-adjusted enrichment inside the core radius and 0 outside.
+    """
+    grid_size = core_radius * 2 + 1
+    inside = distance_map(grid_size, "euclidean", center=core_radius) <= core_radius
+    return np.where(inside, enrichment * (1 - control_rod_level / 100), 0.0)
@@ -0,0 +1,88 @@
+# core_render.py — bounded-cost rendering of core maps
+
+import io
+import math
+import numpy as np
+from matplotlib.figure import Figure
+import matplotlib
+
+MAX_SIDE = 400  # largest number of image cells drawn along one axis
+LABEL_LIMIT = 25  # largest visible window (cells per side) that gets per-cell labels
+
+
+def block_reduce(values, factor, reduce=np.nanmean):
+    """
+    Shrinks a 2-D array by `factor` along both axes, combining each
+    factor×factor block with `reduce`. Edges are padded with NaN so partial
+    blocks are reduced over the cells they actually contain.
+    """
+    if factor <= 1:
+        return values
+    rows, cols = values.shape
+    padded = np.full((math.ceil(rows / factor) * factor, math.ceil(cols / factor) * factor), np.nan)
+    padded[:rows, :cols] = values
+    blocks = padded.reshape(padded.shape[0] // factor, factor, padded.shape[1] // factor, factor)
+    return reduce(blocks, axis=(1, 3))
+
+
+def view_window(grid_size, center=None, size=None):
+    """
+    (row0, row1, col0, col1) of a size×size window around center (row, col),
+    shifted to stay inside the grid. Returns the whole grid when size is None.
+    """
+    if size is None or size >= grid_size:
+        return 0, grid_size, 0, grid_size
+    row, col = center if center is not None else (grid_size // 2, grid_size // 2)
+    row0 = min(max(row - size // 2, 0), grid_size - size)
+    col0 = min(max(col - size // 2, 0), grid_size - size)
+    return row0, row0 + size, col0, col0 + size
+
+
+def render_core(model, window=None, max_side=MAX_SIDE, label_limit=LABEL_LIMIT):
+    """
+    Draws the power map of a core model (see core_model.build_core) as a
+    single image. Returns a matplotlib Figure that is not registered with
+    pyplot, so it is released as soon as the caller drops it.
+
+    The visible window is block-averaged down to at most max_side cells per
+    side, so the cost depends on max_side rather than on the grid size.
+    Per-cell labels are drawn only when the window is at most label_limit
+    cells across.
+    """
+    grid_size = model["power"].shape[0]
+    row0, row1, col0, col1 = window or (0, grid_size, 0, grid_size)
+    power = model["power"][row0:row1, col0:col1]
+    factor = math.ceil(max(power.shape) / max_side)
+    image = block_reduce(power, factor)
+
+    fig = Figure(figsize=(8, 8))
+    ax = fig.subplots()
+    cmap = matplotlib.colormaps["inferno"].with_extremes(under="black")
+    # extent keeps axis coordinates in grid cells whatever the reduction
+    im = ax.imshow(image, cmap=cmap, vmin=0.01, interpolation="nearest",
+                   extent=(col0 - 0.5, col1 - 0.5, row1 - 0.5, row0 - 0.5))
+    fig.colorbar(im, ax=ax, label="Thermal Power (MWt)")
+
+    if factor == 1 and max(power.shape) <= label_limit:
+        core = model["core"]
+        rods = model["rods"][row0:row1, col0:col1]
+        for i, j in zip(*np.nonzero(rods)):
+            ax.text(col0 + j, row0 + i, "CR", ha='center', va='center', color='white', fontsize=7)
+        for i, j in zip(*np.nonzero(~rods)):
+            ax.text(col0 + j, row0 + i, f"{core[row0 + i, col0 + j]:.1f}%", ha='center', va='center', fontsize=6)
+
+    title = "Core Fuel Layout & Power Distribution"
+    if factor > 1:
+        title += f" ({factor}×{factor} cell average)"
+    ax.set_title(title)
+    if (row1 - row0, col1 - col0) == (grid_size, grid_size):
+        ax.set_xticks([])
+        ax.set_yticks([])
+    return fig
+
+
+def render_core_png(model, window=None, max_side=MAX_SIDE, label_limit=LABEL_LIMIT, dpi=100):
+    """render_core as PNG bytes, suitable for caching and st.image."""
+    buffer = io.BytesIO()
+    render_core(model, window, max_side, label_limit).savefig(buffer, format="png", dpi=dpi)
+    return buffer.getvalue()
@@ -0,0 +1,180 @@
+# diffusion.py — two-group finite-difference neutron diffusion eigenvalue solver
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as sla
+
+NU = 2.43  # neutrons per fission
+ASSEMBLY_PITCH = 21.5  # cm, PWR fuel assembly
+
+# Illustrative two-group constants (cm, 1/cm). Fuel constants vary linearly
+# with enrichment E (%), giving k_inf ≈ 1.3 at 3 % — the right ballpark for
+# fresh PWR fuel, not evaluated data.
+fuel_constants = {
+    "D1": 1.4, "D2": 0.4,
+    "absorption1": (0.008, 0.0007),  # (constant, per % enrichment)
+    "absorption2": (0.05, 0.01),
+    "scatter12": 0.017,
+    "nu_fission1": (0.0, 0.0023),
+    "nu_fission2": (0.0, 0.045),
+}
+rod_constants = {"D1": 1.2, "D2": 0.3, "absorption1": 0.02, "absorption2": 0.35, "scatter12": 0.01}
+reflector_constants = {"D1": 1.2, "D2": 0.15, "absorption1": 0.0005, "absorption2": 0.02, "scatter12": 0.05}
+
+# Thermal absorption added to fuel per unit of partial rod insertion (0..1)
+ROD_ABSORPTION = 0.06
+
+# Krylov basis size; a small basis restarts often, which is what lets a
+# warm-started source converge in a handful of operator applications.
+_ARNOLDI_VECTORS = 6
+
+
+def group_constants(enrichment, rods=None, insertion=0.0):
+    """
+    Per-cell two-group constants as a dict of arrays shaped like enrichment.
+
+    enrichment — % U-235 per cell; cells at or below 0 are water reflector
+    rods       — boolean mask of fully rodded cells
+    insertion  — partial rod insertion (0..1) smeared over every fuel cell
+    """
+    e = np.asarray(enrichment, dtype=float)
+    fuel = e > 0
+    rods = np.zeros(e.shape, dtype=bool) if rods is None else np.asarray(rods, dtype=bool)
+    fuel &= ~rods
+
+    def pick(key):
+        value = fuel_constants[key]
+        fuel_value = value[0] + value[1] * e if isinstance(value, tuple) else value
+        other = np.where(rods, rod_constants.get(key, 0.0), reflector_constants.get(key, 0.0))
+        return np.where(fuel, fuel_value, other)
+
+    constants = {key: pick(key) for key in fuel_constants}
+    constants["absorption2"] = constants["absorption2"] + np.where(fuel, ROD_ABSORPTION * insertion, 0.0)
+    return constants
+
+
+def diffusion_operator(D, removal, pitch, boundary="vacuum"):
+    """
+    Sparse matrix of -∇·D∇ + removal on a cell-centred grid of any dimension,
+    with 5-point (2-D) or 7-point (3-D) coupling through the harmonic mean of
+    neighbouring diffusion coefficients.
+
+    boundary — "vacuum" (Marshak condition) or "reflective" (zero current)
+    """
+    shape = D.shape
+    index = np.arange(D.size).reshape(shape)
+    diagonal = removal.astype(float).ravel().copy()
+    rows, cols, values = [], [], []
+
+    for axis in range(D.ndim):
+        lo = [slice(None)] * D.ndim
+        hi = [slice(None)] * D.ndim
+        lo[axis], hi[axis] = slice(0, -1), slice(1, None)
+        D_lo, D_hi = D[tuple(lo)], D[tuple(hi)]
+        coupling = (2 * D_lo * D_hi / (D_lo + D_hi) / pitch ** 2).ravel()
+        i, j = index[tuple(lo)].ravel(), index[tuple(hi)].ravel()
+        np.add.at(diagonal, i, coupling)
+        np.add.at(diagonal, j, coupling)
+        rows += [i, j]
+        cols += [j, i]
+        values += [-coupling, -coupling]
+
+        if boundary == "vacuum":
+            for edge in (0, -1):
+                face = [slice(None)] * D.ndim
+                face[axis] = edge
+                D_edge = D[tuple(face)]
+                np.add.at(diagonal, index[tuple(face)].ravel(), (2 * D_edge / (pitch * (pitch + 4 * D_edge))).ravel())
+        elif boundary != "reflective":
+            raise ValueError(f"Unknown boundary condition '{boundary}'.")
+
+    rows.append(np.arange(D.size))
+    cols.append(np.arange(D.size))
+    values.append(diagonal)
+    return sp.csc_matrix((np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+                         shape=(D.size, D.size))
+
+
+def _factorize(matrix):
+    # The operators are symmetric and diagonally dominant: order on A + Aᵀ
+    # and keep diagonal pivots, which roughly halves the fill of the default.
+    return sla.splu(matrix, permc_spec="MMD_AT_PLUS_A", diag_pivot_thresh=0.0,
+                    options={"SymmetricMode": True})
+
+
+def solve_diffusion(enrichment, rods=None, pitch=1.26, insertion=0.0, boundary="vacuum",
+                    guess=None, tol=1e-6, max_iterations=2000):
+    """
+    Solves the two-group k-eigenvalue problem
+
+        -∇·D1∇φ1 + (Σa1 + Σ12) φ1 = (νΣf1 φ1 + νΣf2 φ2) / k
+        -∇·D2∇φ2 + Σa2 φ2         = Σ12 φ1
+
+    on the grid of `enrichment` (2-D or 3-D, cell size `pitch` cm).
+
+    Both group operators are factorized once; the fission-source iteration
+    S ← F M⁻¹ S / k is then driven by ARPACK (a restarted, Krylov-accelerated
+    power iteration), falling back to plain power iteration if it stalls.
+    Passing the previous result as `guess` warm-starts the source, which cuts
+    the iteration count when sliders move by small steps.
+
+    Returns a dict with "k_eff", "flux_fast", "flux_thermal", "power"
+    (fission-rate shape summing to 1), "source" and "iterations".
+
+    Example:
+    result = solve_diffusion(build_core(100, 3.0, 0.02, 1.0)["core"].clip(0), pitch=3.4)
+    """
+    c = group_constants(enrichment, rods, insertion)
+    shape = c["D1"].shape
+    n = c["D1"].size
+    fast = _factorize(diffusion_operator(c["D1"], c["absorption1"] + c["scatter12"], pitch, boundary))
+    thermal = _factorize(diffusion_operator(c["D2"], c["absorption2"], pitch, boundary))
+    scatter12, nu_fission1, nu_fission2 = c["scatter12"].ravel(), c["nu_fission1"].ravel(), c["nu_fission2"].ravel()
+
+    def fluxes(source):
+        phi1 = fast.solve(source)
+        return phi1, thermal.solve(scatter12 * phi1)
+
+    def next_source(source):
+        counter[0] += 1
+        phi1, phi2 = fluxes(source)
+        return nu_fission1 * phi1 + nu_fission2 * phi2
+
+    counter = [0]
+    if guess is not None and guess["source"].size == n:
+        source = np.asarray(guess["source"], dtype=float).ravel()
+    else:
+        source = (nu_fission1 + nu_fission2).astype(float)
+    if not source.any():
+        raise ValueError("Core contains no fissile material.")
+
+    try:
+        operator = sla.LinearOperator((n, n), matvec=next_source, dtype=float)
+        values, vectors = sla.eigs(operator, k=1, which="LM", v0=source, ncv=_ARNOLDI_VECTORS, tol=tol,
+                                  maxiter=max_iterations)
+        k_eff = float(values[0].real)
+        source = vectors[:, 0].real
+        source *= np.sign(source.sum())
+    except sla.ArpackNoConvergence:
+        k_eff = 1.0
+        for _ in range(max_iterations):
+            new_source = next_source(source) / k_eff
+            new_k = k_eff * new_source.sum() / source.sum()
+            converged = abs(new_k - k_eff) < tol * new_k and \
+                np.abs(new_source - source).max() < 10 * tol * np.abs(new_source).max()
+            source, k_eff = new_source, new_k
+            if converged:
+                break
+
+    source = np.clip(source, 0.0, None)
+    source /= source.sum()
+    phi1, phi2 = fluxes(source / k_eff)
+    power = (nu_fission1 * phi1 + nu_fission2 * phi2) / NU
+    return {
+        "k_eff": k_eff,
+        "flux_fast": phi1.reshape(shape),
+        "flux_thermal": phi2.reshape(shape),
+        "power": (power / power.sum()).reshape(shape),
+        "source": source,
+        "iterations": counter[0],
+    }
@@ -0,0 +1,184 @@
+# point_kinetics.py — six-group point reactor kinetics with batched reactivity scenarios
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.integrate import solve_ivp
+
+# Keepin six-group delayed neutron data, thermal fission of U-235
+keepin_groups = {
+    "beta": np.array([0.000215, 0.001424, 0.001274, 0.002568, 0.000748, 0.000273]),
+    "decay_constant": np.array([0.0124, 0.0305, 0.111, 0.301, 1.14, 3.01]),  # 1/s
+}
+GENERATION_TIME = 2e-5  # s, prompt neutron generation time Λ of a thermal PWR core
+OUTPUT_DT = 1e-3  # s
+CHUNK_POINTS = 2_000_000  # scenario × mode × output values evaluated at once
+EXACT_CHUNK = 65_536  # output points per chunk of precomputed mode exponentials
+
+
+def step_insertion(rho, at=0.0):
+    """Reactivity schedule for a step of rho (Δk/k) at time `at` (s)."""
+    return np.array([0.0, at, at]), np.array([0.0, 0.0, rho])
+
+
+def ramp_insertion(rho, duration, start=0.0):
+    """Reactivity schedule for a linear ramp to rho over `duration` seconds from `start`."""
+    if duration <= 0:
+        return step_insertion(rho, start)
+    return np.array([0.0, start, start + duration]), np.array([0.0, 0.0, rho])
+
+
+def rod_worth(enrichment, rods, pitch, **diffusion_options):
+    """
+    Reactivity (Δk/k, negative) of inserting the rod pattern `rods` into
+    the rods-out core, from two two-group diffusion solves.
+    """
+    from reactor_diagram.diffusion import solve_diffusion
+
+    k_out = solve_diffusion(enrichment, None, pitch, **diffusion_options)["k_eff"]
+    k_in = solve_diffusion(enrichment, rods, pitch, **diffusion_options)["k_eff"]
+    return (k_in - k_out) / (k_in * k_out)
+
+
+def _segments(schedules, t_end):
+    """
+    Merges the breakpoints of every schedule into one sorted set of
+    segments; within each, every scenario's reactivity is linear. Returns the
+    segment starts (K + 1 edges) and per-scenario (S, K) values and slopes.
+    """
+    edges = np.unique(np.concatenate([[0.0, t_end], *[np.clip(t, 0, t_end) for t, _ in schedules]]))
+    # Interior points are never on a breakpoint, so steps (repeated times) resolve unambiguously
+    a = edges[:-1] + (edges[1:] - edges[:-1]) / 3
+    b = edges[:-1] + 2 * (edges[1:] - edges[:-1]) / 3
+    ra = np.array([np.interp(a, t, r) for t, r in schedules])
+    rb = np.array([np.interp(b, t, r) for t, r in schedules])
+    slope = (rb - ra) / (b - a)
+    start = ra - slope * (a - edges[:-1])
+    return edges, start, slope
+
+
+def _system_matrices(rho, beta, lam, generation_time):
+    """(S, 7, 7) point-kinetics matrices for the reactivities rho, state (n, C1..C6)."""
+    groups = beta.size
+    A = np.zeros((rho.size, groups + 1, groups + 1))
+    A[:, 0, 0] = (rho - beta.sum()) / generation_time
+    A[:, 0, 1:] = lam
+    A[:, 1:, 0] = beta / generation_time
+    A[:, np.arange(1, groups + 1), np.arange(1, groups + 1)] = -lam
+    return A
+
+
+def _exact_segment(A, state, first, dt, count, length, chunk):
+    """
+    Constant reactivity: y(τ) = V·exp(Wτ)·V⁻¹·y0 from the eigen-decomposition
+    of each scenario's matrix (its modes are the inhour roots). Returns the
+    power at the `count` offsets first + j·dt and the state at `length`.
+
+    On the uniform output grid exp(w(τc + m·dt)) = exp(w·τc)·exp(w·m·dt), so
+    one chunk of exponentials is computed and rescaled for every chunk.
+    """
+    rates, vectors = np.linalg.eig(A)
+    coefficients = np.linalg.solve(vectors, state[..., None].astype(vectors.dtype))[..., 0]
+    weights = vectors[:, 0, :] * coefficients  # power carried by each mode
+    power = np.empty((state.shape[0], count))
+    with np.errstate(over="ignore", under="ignore", invalid="ignore"):
+        base = np.exp(rates[:, :, None] * (dt * np.arange(min(chunk, count)))[None, None, :])
+        for i in range(0, count, chunk):
+            scale = weights * np.exp(rates * (first + i * dt))
+            power[:, i:i + chunk] = np.einsum("sk,skj->sj", scale, base[:, :, :count - i]).real
+        final = np.einsum("sik,sk->si", vectors, coefficients * np.exp(rates * length)).real
+    return power, final
+
+
+def _integrated_segment(A0, dA, state, t0, t1, tau, rtol, atol):
+    """
+    Ramped reactivity: the batch as one block-diagonal system, A(t) = A0 +
+    (t − t0)·dA, integrated by an adaptive Radau IIA (fifth-order, L-stable)
+    solver with its exact block-sparse Jacobian.
+    """
+    scenarios, size = state.shape
+    blocks = np.arange(scenarios)
+
+    def matrices(t):
+        return A0 + (t - t0) * dA
+
+    def rhs(t, y):
+        return np.einsum("sij,sj->si", matrices(t), y.reshape(scenarios, size)).ravel()
+
+    def jacobian(t, y):
+        return sp.bsr_matrix((matrices(t), blocks, np.arange(scenarios + 1)), shape=(y.size, y.size))
+
+    solution = solve_ivp(rhs, (t0, t1), state.ravel(), method="Radau", jac=jacobian, rtol=rtol, atol=atol,
+                         dense_output=True)
+    if not solution.success:
+        raise RuntimeError(f"Kinetics integration failed: {solution.message}")
+    power = solution.sol(t0 + tau)[0::size] if tau.size else np.empty((scenarios, 0))
+    return power, solution.y[:, -1].reshape(scenarios, size), solution.t.size - 1
+
+
+def simulate_transient(schedules, t_end, output_dt=OUTPUT_DT, beta=None, decay_constants=None,
+                       generation_time=GENERATION_TIME, rtol=1e-6, atol=1e-9, chunk_points=CHUNK_POINTS):
+    """
+    Solves the point reactor kinetics equations
+
+        dn/dt  = (ρ(t) − β)/Λ · n + Σ λi Ci
+        dCi/dt = βi/Λ · n − λi Ci
+
+    for a batch of reactivity scenarios at once, starting from steady state
+    at power 1.
+
+    schedules — list of (times, rho) piecewise-linear reactivity schedules
+                (see step_insertion, ramp_insertion); repeat a time for a step
+    t_end     — simulated time (s); output every output_dt seconds
+
+    The breakpoints of all schedules split the run into segments, and
+    every segment is solved for the whole batch at once.
+
+    - Constant reactivity (steps, holds): solved exactly from the matrix
+      eigen-decomposition, whatever the segment's length. Millisecond
+      output over hours costs array work rather than integration steps.
+    - Ramps: integrated with an adaptive, L-stable Radau IIA method. This
+      takes the stiff prompt mode (|ω| ≈ β/Λ ≈ 300 s⁻¹) in its stride, and
+      its dense output gives the power between steps.
+
+    Returns a dict with "time" (J,), "power" (S, J), "reactivity" (S, J),
+    "precursors" (S, 6) at t_end and "steps" (integrator steps, 0 for
+    pure step insertions).
+
+    Example:
+    result = simulate_transient([step_insertion(0.001), ramp_insertion(-0.01, 2.0)], t_end=3600)
+    """
+    beta = keepin_groups["beta"] if beta is None else np.asarray(beta, dtype=float)
+    lam = keepin_groups["decay_constant"] if decay_constants is None else np.asarray(decay_constants, dtype=float)
+    schedules = [(np.asarray(t, dtype=float), np.asarray(r, dtype=float)) for t, r in schedules]
+    scenarios = len(schedules)
+    edges, rho0, slope = _segments(schedules, t_end)
+
+    times = np.arange(0.0, t_end + 0.5 * output_dt, output_dt)
+    power = np.empty((scenarios, times.size))
+    power[:, 0] = 1.0
+    state = np.empty((scenarios, beta.size + 1))
+    state[:, 0] = 1.0
+    state[:, 1:] = beta / (generation_time * lam)  # steady-state precursors
+    chunk = max(1, min(EXACT_CHUNK, chunk_points // (state.shape[1] * scenarios)))
+
+    steps, written = 0, 1
+    for k in range(edges.size - 1):
+        t0, t1 = edges[k], edges[k + 1]
+        stop = np.searchsorted(times, t1, side="right")
+        tau = times[written:stop] - t0
+        A0 = _system_matrices(rho0[:, k], beta, lam, generation_time)
+        if not slope[:, k].any():
+            first = tau[0] if tau.size else 0.0
+            segment_power, state = _exact_segment(A0, state, first, output_dt, tau.size, t1 - t0, chunk)
+        else:
+            dA = np.zeros_like(A0)
+            dA[:, 0, 0] = slope[:, k] / generation_time
+            segment_power, state, taken = _integrated_segment(A0, dA, state, t0, t1, tau, rtol, atol)
+            steps += taken
+        power[:, written:stop] = segment_power
+        written = stop
+
+    reactivity = np.empty_like(power)
+    for row, (t, r) in zip(reactivity, schedules):
+        row[:] = np.interp(times, t, r)
+    return {"time": times, "power": power, "reactivity": reactivity, "precursors": state[:, 1:], "steps": steps}
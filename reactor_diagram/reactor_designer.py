@@ -1,6 +1,20 @@
 import streamlit as st
 import matplotlib.pyplot as plt
 import numpy as np
+from reactor_diagram.core_model import distance_map, reactivity_map
+from reactor_diagram.diffusion import ASSEMBLY_PITCH, solve_diffusion
+
+MAX_CORE_RADIUS = 100  # cells; a 201×201 diffusion solve takes about 0.3 s
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _k_eff(core_radius, enrichment, insertion):
+    """Two-group diffusion k-eff of a round core, cached per design."""
+    # Cells outside the core are water
+    inside = distance_map(core_radius * 2 + 1, "euclidean", center=core_radius) <= core_radius
+    fuel = np.where(inside, enrichment, 0.0)
+    return solve_diffusion(fuel, pitch=ASSEMBLY_PITCH, insertion=insertion)["k_eff"]
+
 
 def reactor_designer_tool():
     st.subheader("🧱 Reactor Core Designer")
@@ -15,19 +29,10 @@ This is a simplified visual simulator.
  # Parameters
     enrichment = st.slider("Fuel Enrichment (%)", 0.7, 5.0, 3.0, step=0.1)
     control_rod_level = st.slider("Control Rod Insertion (%)", 0, 100, 50, step=5)
-    core_radius = st.slider("Core Radius (cells)", 3, 10, 5)
-
-    # Core grid simulation
-    grid_size = core_radius * 2 + 1
-    core = np.zeros((grid_size, grid_size))
+    core_radius = st.slider("Core Radius (cells)", 3, MAX_CORE_RADIUS, 5)
 
-    # Fill with fuel (high = enriched), low = rods
-    for i in range(grid_size):
-        for j in range(grid_size):
-            distance = np.sqrt((i - core_radius) ** 2 + (j - core_radius) ** 2)
-            if distance <= core_radius:
-                fuel_effectiveness = enrichment * (1 - control_rod_level / 100)
-                core[i, j] = fuel_effectiveness
+    # Core grid simulation: rod-adjusted enrichment inside the core radius
+    core = reactivity_map(core_radius, enrichment, control_rod_level)
 
     # Visualization
     fig, ax = plt.subplots(figsize=(6, 6))
@@ -37,8 +42,8 @@ This is a simplified visual simulator.
     ax.axis("off")
     st.pyplot(fig)
 
-    # Summary
-    k_eff_estimate = round((enrichment / 5) * (1 - control_rod_level / 100), 3)
+    # Summary: two-group diffusion on the same grid
+    k_eff_estimate = round(_k_eff(core_radius, enrichment, control_rod_level / 100), 3)
     st.markdown(f"### 🔢 Estimated k-effective: `{k_eff_estimate}`")
 
     if k_eff_estimate < 0.95:
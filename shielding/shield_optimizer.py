@@ -0,0 +1,175 @@
+# shield_optimizer.py — branch-and-bound search for the cheapest layered shield
+
+import itertools
+import math
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from shielding.attenuation import buildup_factor, densities, linear_attenuation, transmission
+from shielding.shielding_simulator import shielding_factors
+
+# Illustrative bulk prices ($/kg) for the "cost" objective
+material_costs = {
+    "Paper": 1.0,
+    "Aluminum": 3.0,
+    "Lead": 2.5,
+    "Concrete": 0.1,
+    "Water": 0.01,
+    "Borated Polyethylene": 10.0,
+    "Polycarbonate": 4.0,
+    "Glass": 2.0,
+    "Steel": 1.0,
+    "Air": 0.0,
+    "Graphite": 8.0,
+}
+
+# Units of each objective, per m² of shield face
+objective_units = {"thickness": "cm", "mass": "kg/m²", "cost": "$/m²"}
+
+STACKS_PER_TASK = 64  # stack orders evaluated per pool task
+_MAX_MFP = 80.0  # deepest penetration considered, mean free paths
+
+
+def objective_rates(names, objective):
+    """Objective added per cm of each material: cm, kg/m² or $/m²."""
+    if objective == "thickness":
+        return np.ones(len(names))
+    if objective == "mass":
+        return np.array([10 * densities[n] for n in names])
+    if objective == "cost":
+        return np.array([10 * densities[n] * material_costs[n] for n in names])
+    raise ValueError(f"Unknown objective '{objective}'.")
+
+
+def required_mfp(material, energy_MeV, target_fraction, resolution=0.005):
+    """
+    Smallest total depth (mean free paths) beyond which a stack ending in
+    `material` transmits at most target_fraction, buildup included. Returns
+    inf when the target cannot be reached within _MAX_MFP.
+    """
+    if target_fraction >= 1:
+        return 0.0
+    depth = np.arange(0, _MAX_MFP + resolution, resolution)
+    too_high = np.exp(-depth) * buildup_factor(material, depth, energy_MeV) > target_fraction
+    if too_high[-1]:
+        return math.inf
+    return float(depth[np.nonzero(too_high)[0][-1] + 1]) if too_high.any() else 0.0
+
+
+def _evaluate_stacks(stacks, step, max_thickness, bound):
+    """
+    Best thicknesses for each ordered stack on a grid of `step` cm.
+
+    Each stack is (names, mu, rates, depth): inner layers are enumerated
+    layer by layer on the grid, dropping partial stacks whose lower bound
+    already reaches `bound`; the outer layer is then sized directly to make
+    up the remaining depth. Returns (best or None, partial stacks evaluated).
+    """
+    best, evaluated = None, 0
+    grid = step * np.arange(1, int(max_thickness / step + 1e-9) + 1)
+    for names, mu, rates, depth in stacks:
+        cost = np.zeros(1)
+        mfp = np.zeros(1)
+        thickness = np.zeros((1, 0))
+        for i in range(len(names) - 1):
+            cost = (cost[:, None] + rates[i] * grid).ravel()
+            mfp = (mfp[:, None] + mu[i] * grid).ravel()
+            thickness = np.column_stack([np.repeat(thickness, grid.size, axis=0), np.tile(grid, len(thickness))])
+            # Lower bound: later layers at least one step, the rest of the
+            # depth bought at the best cost per mean free path still available
+            rest = slice(i + 1, None)
+            minimum = step * rates[rest].sum()
+            shortfall = np.maximum(depth - mfp - step * mu[rest].sum(), 0)
+            keep = cost + minimum + shortfall * (rates[rest] / mu[rest]).min() < bound
+            cost, mfp, thickness = cost[keep], mfp[keep], thickness[keep]
+            evaluated += keep.size
+            if not keep.any():
+                break
+        else:
+            last = np.maximum(np.ceil((depth - mfp) / mu[-1] / step - 1e-9), 1) * step
+            total = cost + rates[-1] * last
+            total[last > max_thickness] = math.inf
+            evaluated += total.size
+            if total.size and total.min() < bound:
+                k = int(total.argmin())
+                bound = float(total[k])
+                best = (bound, list(zip(names, [*thickness[k], last[k]])))
+    return best, evaluated
+
+
+def optimize_shield(initial_dose, target_dose, energy_MeV=1.0, objective="thickness", materials=None,
+                    max_layers=3, step=0.5, max_thickness=20.0, workers=None):
+    """
+    Searches ordered stacks of up to max_layers distinct materials, each
+    layer a multiple of `step` cm up to max_thickness, for the one that
+    brings initial_dose down to target_dose at the lowest objective:
+    total "thickness" (cm), "mass" (kg/m²) or "cost" ($/m², see
+    material_costs).
+
+    Stack orders are ranked by a lower bound and evaluated in batches
+    (across a process pool when workers > 1); any order whose bound cannot
+    beat the best stack found so far is pruned without being evaluated.
+
+    Returns a dict with "layers" (list of (material, thickness_cm)),
+    "objective", "transmission", "stacks" (orders considered), "pruned"
+    (orders skipped by the bound) and "evaluated" (partial stacks scored).
+
+    Example:
+    result = optimize_shield(1000, 1, energy_MeV=1.25, objective="cost", max_layers=3)
+    """
+    if target_dose <= 0 or initial_dose <= 0:
+        raise ValueError("Doses must be positive.")
+    names = [m.title() for m in (materials or list(shielding_factors))]
+    target_fraction = target_dose / initial_dose
+    mu = dict(zip(names, linear_attenuation(names, energy_MeV)))
+    rates = dict(zip(names, objective_rates(names, objective)))
+    depth = {n: required_mfp(n, energy_MeV, target_fraction) for n in names}
+
+    candidates = []
+    for count in range(1, max_layers + 1):
+        for order in itertools.permutations(names, count):
+            need = depth[order[-1]]
+            if math.isinf(need):
+                continue
+            stack_mu = np.array([mu[n] for n in order])
+            stack_rates = np.array([rates[n] for n in order])
+            # Every layer at least one step, remaining depth at the best rate in the stack
+            floor = step * stack_rates[:-1].sum() + step * stack_rates[-1]
+            shortfall = max(need - step * stack_mu.sum(), 0)
+            bound = floor + shortfall * (stack_rates / stack_mu).min()
+            candidates.append((bound, (order, stack_mu, stack_rates, need)))
+    candidates.sort(key=lambda c: c[0])
+
+    best, incumbent, evaluated, considered = None, math.inf, 0, 0
+    pool = ProcessPoolExecutor(max_workers=workers) if workers and workers > 1 else None
+    wave = STACKS_PER_TASK * (workers if pool is not None else 1)
+    try:
+        for start in range(0, len(candidates), wave):
+            batch = [stack for bound, stack in candidates[start:start + wave] if bound < incumbent]
+            if not batch:
+                break  # sorted by bound, so nothing later can win either
+            considered += len(batch)
+            tasks = [batch[i:i + STACKS_PER_TASK] for i in range(0, len(batch), STACKS_PER_TASK)]
+            if pool is None:
+                results = [_evaluate_stacks(t, step, max_thickness, incumbent) for t in tasks]
+            else:
+                n = len(tasks)
+                results = pool.map(_evaluate_stacks, tasks, [step] * n, [max_thickness] * n, [incumbent] * n)
+            for found, count in results:
+                evaluated += count
+                if found is not None and found[0] < incumbent:
+                    incumbent, best = found
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if best is None:
+        raise ValueError("No stack within the thickness limits reaches the target dose.")
+    layers = [(name, float(t)) for name, t in best]
+    return {
+        "layers": layers,
+        "objective": incumbent,
+        "transmission": float(transmission(layers, energy_MeV)),
+        "stacks": len(candidates),
+        "pruned": len(candidates) - considered,
+        "evaluated": evaluated,
+    }
@@ -1,5 +1,7 @@
 # shielding_simulator.py
 
+from shielding.attenuation import transmission
+
 shielding_factors = {
     "Paper": 0.05,
     "Aluminum": 0.3,
@@ -14,10 +16,23 @@ shielding_factors = {
     "Graphite": 0.5
 }
 
-def calculate_shielded_dose(initial_dose, material):
+def calculate_shielded_dose(initial_dose, material, thickness_cm=None, energy_MeV=1.0, buildup=True):
+    """
+    Dose left after a shield. Without a thickness the material's fixed
+    blocked fraction is used; with one, the fraction comes from energy-
+    dependent attenuation (see shielding.attenuation.transmission).
+
+    Returns (transmitted_dose, blocked_fraction).
+
+    Example:
+    calculate_shielded_dose(100, "Lead", thickness_cm=5, energy_MeV=0.662)
+    """
     material = material.title()
     if material not in shielding_factors:
         raise ValueError(f"Material '{material}' not supported.")
-    blocked_fraction = shielding_factors[material]
+    if thickness_cm is None:
+        blocked_fraction = shielding_factors[material]
+    else:
+        blocked_fraction = 1 - float(transmission([(material, thickness_cm)], energy_MeV, buildup))
     transmitted_dose = initial_dose * (1 - blocked_fraction)
-    return transmitted_dose, blocked_fraction
\ No newline at end of file
+    return transmitted_dose, blocked_fraction
@@ -0,0 +1,33 @@
+# toolbox_pages — page registry for app.py
+#
+# Pages are listed as "module:function" strings and imported only when they
+# are first opened, so a rerun of one page never pays for the imports
+# (matplotlib, sympy, graphviz, pandas, ...) of the others.
+
+import importlib
+
+pages = {
+    "🏠 Home": "toolbox_pages.home:home",
+    "📉 Radioactive Decay": "toolbox_pages.decay:radioactive_decay",
+    "🔗 Decay Chain Viewer": "toolbox_pages.chains:decay_chain_viewer",
+    "📟 Exposure Calculator": "toolbox_pages.exposure:exposure_calculator",
+    "📊 Radiation Dose Chart": "toolbox_pages.exposure:dose_chart",
+    "🔁 Radiation Unit Converter": "toolbox_pages.exposure:unit_converter",
+    "📋 Radiation Types": "toolbox_pages.exposure:radiation_types",
+    "🛡️ Shielding Simulation": "toolbox_pages.shielding:shielding_simulation",
+    "🔧 Reactor Core Designer": "toolbox_pages.reactor:core_designer",
+    "🔍 Isotope Search": "isotopes_database.isotope_search:isotope_searcher",
+    "⚖️ Compare Isotopes": "isotopes_database.isotope_compare:compare_isotopes",
+    "⚛️ Criticality Calculator": "decay_math.criticality_calculator:criticality_calculator",
+    "🧩 Custom Equation Builder": "toolbox_pages.equation_builder:equation_builder",
+    "📄 Terms of Use": "toolbox_pages.home:terms_of_use",
+}
+
+
+def load_page(label):
+    """
+    Imports the module of a page and returns its render function.
+    Raises KeyError for an unknown label.
+    """
+    module_name, _, function_name = pages[label].partition(":")
+    return getattr(importlib.import_module(module_name), function_name)
@@ -0,0 +1,70 @@
+# chains.py — decay chain viewer page
+
+import streamlit as st
+import numpy as np
+from decay_math.units import factor
+from graph_export.diagram_cache import show_diagram
+
+TIME_POINTS = 400
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _chain_view(root, log_start, log_end):
+    """
+    Times (years), member activities relative to the root's initial
+    activity, and the DOT graph shaded by the activities at the end of the
+    range; cached per (root, time range) so switching series is instant
+    after the first view.
+    """
+    from isotopes_database.decay_chains import decay_chains
+
+    chain = decay_chains[root]
+    years = np.logspace(log_start, log_end, TIME_POINTS)
+    activity = chain.activity(years * factor("y", "s"))
+    activity /= chain.decay_constant[0]
+    return years, activity, chain.dot_source(activity[:, -1])
+
+
+def decay_chain_viewer():
+    from matplotlib.figure import Figure
+    from isotopes_database.decay_chains import decay_chains
+
+    st.subheader("🔗 Decay Chain Viewer")
+    st.markdown("""
+    Follow a decay series from its parent to the stable end member. Each box
+    shows a member's half-life and its activity relative to the parent's initial
+    activity at the end of the chosen time range; edges show branching ratios.
+    After long enough, every member reaches **secular equilibrium** with the parent.
+    """)
+
+    root = st.selectbox("Decay Series", list(decay_chains))
+    log_start, log_end = st.slider("Time Range (log₁₀ years)", -8.0, 11.0, (-6.0, 10.0), 0.5)
+    if log_end <= log_start:
+        st.warning("The time range is empty.")
+        return
+    chain = decay_chains[root]
+    years, activity, dot = _chain_view(root, log_start, log_end)
+
+    show_diagram(dot)
+
+    st.markdown("### 📈 Member Activities")
+    radioactive = [name for name, half_life in zip(chain.members, chain.half_life_s) if np.isfinite(half_life)]
+    shown = st.multiselect("Members", list(chain.members), default=radioactive)
+    fig = Figure(figsize=(9, 5))
+    ax = fig.subplots()
+    for name in shown:
+        ax.plot(years, activity[chain.index(name)], label=name)
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.set_ylim(1e-12, 2)
+    ax.set_xlabel("Time (years)")
+    ax.set_ylabel("Activity / Initial Parent Activity")
+    ax.set_title(f"{root} series")
+    ax.grid(True, which="both", alpha=0.3)
+    if shown:
+        ax.legend(ncol=2, fontsize="small")
+    st.pyplot(fig)
+
+    in_table = [name for name, row in zip(chain.members, chain.rows) if row >= 0]
+    if in_table:
+        st.caption(f"Listed in the isotope database: {', '.join(in_table)}")
@@ -0,0 +1,131 @@
+# decay.py — radioactive decay calculator page
+
+import math
+import streamlit as st
+import numpy as np
+
+
+def radioactive_decay():
+    import matplotlib.pyplot as plt
+
+    st.header("📉 Radioactive Decay Calculator")
+
+    N0_input = st.text_input("Initial Quantity (N₀)", "1000")
+    decay_const_input = st.text_input("Decay Constant (λ)", "0.01")
+    time_input = st.text_input("Elapsed Time (t)", "10")
+
+    def decay_remaining(N0, decay_constant, time):
+        return N0 * math.exp(-decay_constant * time)
+
+    def decay_half_life(decay_constant):
+        return math.log(2) / decay_constant
+
+    if st.button("Calculate"):
+        try:
+            N0 = float(N0_input)
+            decay_const = float(decay_const_input)
+            t = float(time_input)
+
+            N = decay_remaining(N0, decay_const, t)
+            half_life = decay_half_life(decay_const)
+
+            st.success(f"📉 Remaining Quantity: {N:,.2f}")
+            st.info(f"⏳ Half-life: {half_life:,.2f} time units")
+
+            # Generate decay graph
+            times = np.linspace(0, t, 100)
+            quantities = N0 * np.exp(-decay_const * times)
+
+            fig, ax = plt.subplots()
+            ax.plot(times, quantities, color="darkgreen", linewidth=2)
+            ax.set_xlabel("Time")
+            ax.set_ylabel("Remaining Quantity")
+            ax.set_title("Radioactive Decay Over Time")
+            ax.grid(True)
+
+            st.pyplot(fig)
+
+        except ValueError:
+            st.error("Please enter valid numbers.")
+
+    with st.expander("📈 Fit Half-Lives from Count Series"):
+        _half_life_fit()
+
+    with st.expander("🪨 Radiometric Dating with Uncertainty"):
+        _radiometric_dating()
+
+
+def _half_life_fit():
+    st.markdown("Upload a CSV whose first column is the measurement time and whose other columns are the "
+                "counts of each sample; empty cells are skipped.")
+    upload = st.file_uploader("Count series", type=["csv"])
+    col1, col2, col3 = st.columns(3)
+    components = col1.radio("Components", [1, 2], horizontal=True)
+    live_time = col2.number_input("Live Time per Point", min_value=1e-6, value=1.0)
+    background = col3.number_input("Background Counts per Point", min_value=0.0, value=0.0)
+    if upload is None:
+        return
+
+    import pandas as pd
+    from decay_math.half_life_fit import fit_half_life, fit_two_component
+
+    fit = fit_half_life if components == 1 else fit_two_component
+    try:
+        table = pd.read_csv(upload)
+        t = table.iloc[:, 0].to_numpy(dtype=float)
+        counts = table.iloc[:, 1:].to_numpy(dtype=float).T
+        result = fit(t, counts, live_time=live_time, background=background)
+    except (ValueError, np.linalg.LinAlgError) as e:
+        st.error(f"Could not fit counts: {e}")
+        return
+    columns = {"sample": table.columns[1:]}
+    if components == 1:
+        columns.update({"half_life": result["half_life"], "half_life_err": result["half_life_err"]})
+    else:
+        for i, name in enumerate(("fast", "slow")):
+            columns[f"half_life_{name}"] = result["half_life"][:, i]
+            columns[f"half_life_{name}_err"] = result["half_life_err"][:, i]
+    columns.update({"reduced_chi2": result["reduced_chi2"], "p_value": result["p_value"]})
+    summary = pd.DataFrame(columns)
+
+    st.caption(f"{len(summary):,} samples fitted; half-lives are in the time unit of the first column.")
+    st.dataframe(summary.head(1000))
+    st.download_button("Download Fits (CSV)", summary.to_csv(index=False), file_name="half_life_fits.csv")
+
+
+def _radiometric_dating():
+    from decay_math.radiometric_dating import ratio_kinds
+
+    st.markdown("Upload a CSV with columns `ratio` and `ratio_err` (1σ), and optionally `sample`. Ages come "
+                "from Monte Carlo draws of the ratio and the half-life, in the half-life's time unit.")
+    upload = st.file_uploader("Measured ratios", type=["csv"])
+    col1, col2 = st.columns(2)
+    kind = col1.selectbox("Ratio", list(ratio_kinds),
+                          format_func={"remaining": "Parent remaining (N / N₀)",
+                                       "daughter": "Daughter / parent (D / P)"}.get)
+    branching = col2.number_input("Branching Fraction to Daughter", min_value=1e-6, max_value=1.0, value=1.0,
+                                  format="%.4f", disabled=kind != "daughter")
+    half_life = col1.number_input("Half-Life", min_value=1e-9, value=5730.0)
+    half_life_err = col2.number_input("Half-Life Uncertainty (1σ)", min_value=0.0, value=40.0)
+    draws = col1.number_input("Draws per Sample", min_value=1000, max_value=1_000_000, value=100_000, step=10_000)
+    confidence = col2.slider("Confidence Interval", min_value=0.5, max_value=0.99, value=0.95)
+    if upload is None:
+        return
+
+    import os
+    import pandas as pd
+    from decay_math.radiometric_dating import date_samples
+
+    try:
+        table = pd.read_csv(upload)
+        result = date_samples(table["ratio"].to_numpy(dtype=float), table["ratio_err"].to_numpy(dtype=float),
+                              half_life, half_life_err, kind=kind, branching=branching, draws=int(draws),
+                              confidence=confidence, workers=os.cpu_count())
+    except (KeyError, ValueError) as e:
+        st.error(f"Could not date samples: {e}")
+        return
+
+    summary = pd.DataFrame({"sample": table["sample"] if "sample" in table else table.index,
+                            **{key: result[key] for key in ("age", "median", "lower", "upper", "std", "rejected")}})
+    st.dataframe(summary.head(1000))
+    st.download_button("Download Ages (CSV)", summary.to_csv(index=False), file_name="radiometric_ages.csv")
@@ -0,0 +1,131 @@
+# equation_builder.py — custom equation builder page
+
+import streamlit as st
+import numpy as np
+
+
+def equation_builder():
+    import matplotlib.pyplot as plt
+    from decay_math.equation_compiler import compile_equation, expression_cache
+
+    st.subheader("🧩 Custom Equation Builder")
+
+    st.markdown("""
+    Enter a symbolic nuclear formula using variables like `N0`, `λ`, and `t`;
+    any other variable names are detected automatically.
+
+    Example:  
+    ```
+    N(t) = N0 * exp(-λ * t)
+    ```
+    """)
+
+    # Input field for user-defined equation
+    user_input = st.text_input("Equation (use Python syntax):", "N(t) = N0 * exp(-λ * t)")
+
+    try:
+        # Parsing and compiling are cached on the equation text, so changing
+        # N0 or λ below only re-evaluates the compiled NumPy function
+        compiled = compile_equation(user_input)
+
+        # Parameter inputs for every variable of the equation except t
+        defaults = {"N0": 100.0, "λ": 0.1}
+        labels = {"N0": "Initial Quantity (N0)", "λ": "Decay Constant (λ)"}
+        values = {name: st.number_input(labels.get(name, name), value=defaults.get(name, 1.0), key=f"value_{name}")
+                  for name in compiled["symbols"] if name != "t"}
+        t_vals = np.linspace(0, 50, 300)
+        values["t"] = t_vals
+
+        # Evaluate expression
+        y_vals = np.broadcast_to(compiled["function"](*[values[s] for s in compiled["symbols"]]), t_vals.shape)
+
+        # Plotting
+        fig, ax = plt.subplots()
+        ax.plot(t_vals, y_vals, label=compiled["latex"])
+        ax.set_xlabel("Time (t)")
+        ax.set_ylabel("Result")
+        ax.set_title("Custom Equation Output")
+        ax.legend()
+        st.pyplot(fig)
+        plt.close(fig)
+
+        with st.expander("🎛️ Sweep & Ensemble Mode"):
+            _sweep_mode(user_input, compiled["symbols"], values)
+
+    except Exception as e:
+        st.error(f"Error: {e}")
+
+    stats = expression_cache.stats()
+    st.caption(f"Expression cache: {stats['size']}/{stats['maxsize']} entries, "
+               f"{stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions")
+
+
+def _sweep_mode(equation, symbols, values):
+    import matplotlib.pyplot as plt
+    from decay_math.equation_sweep import distributions, sweep
+
+    st.markdown("Give each variable a fixed value, a range (up to two become plot axes) or a distribution.")
+    variables, ranged = {}, []
+    for name in symbols:
+        col1, col2, col3, col4 = st.columns([1.2, 1, 1, 1])
+        default = float(values[name]) if np.ndim(values[name]) == 0 else 50.0
+        kind = col1.selectbox(name, ["Fixed", "Range", *distributions], index=int(name == "t"),
+                              key=f"sweep_kind_{name}")
+        if kind == "Fixed":
+            variables[name] = col2.number_input("Value", value=default, key=f"sweep_value_{name}")
+        elif kind == "Range":
+            low = col2.number_input("From", value=0.0, key=f"sweep_low_{name}")
+            high = col3.number_input("To", value=default if default else 1.0, key=f"sweep_high_{name}")
+            steps = col4.number_input("Steps", min_value=2, max_value=5000, value=200, key=f"sweep_steps_{name}")
+            variables[name] = np.linspace(low, high, int(steps))
+            ranged.append(name)
+        elif kind == "triangular":
+            variables[name] = (kind, col2.number_input("Low", value=0.5 * default, key=f"sweep_a_{name}"),
+                               col3.number_input("Mode", value=default, key=f"sweep_b_{name}"),
+                               col4.number_input("High", value=1.5 * default, key=f"sweep_c_{name}"))
+        else:
+            first, second = {"normal": ("Mean", "Std"), "uniform": ("Low", "High"),
+                             "lognormal": ("Log-mean", "Log-sigma")}[kind]
+            a = col2.number_input(first, value=np.log(default) if kind == "lognormal" and default > 0 else default,
+                                  key=f"sweep_a_{name}")
+            b = col3.number_input(second, value={"normal": 0.1 * abs(default), "uniform": 2 * default,
+                                                 "lognormal": 0.2}[kind], key=f"sweep_b_{name}")
+            variables[name] = (kind, a, b)
+    samples = st.number_input("Samples per grid point", min_value=10, max_value=1_000_000, value=1000, step=100)
+
+    if len(ranged) > 2:
+        st.warning("Choose at most two ranged variables.")
+        return
+    if not st.button("Run Sweep"):
+        return
+    with st.spinner("Evaluating..."):
+        result = sweep(equation, variables, samples=int(samples))
+
+    ensemble = "values" not in result
+    if not ranged:
+        st.write({"mean": float(result["mean"]), "min": float(result["min"]), "max": float(result["max"]),
+                  **{f"p{p}": float(q) for p, q in result["percentiles"].items()}} if ensemble
+                 else {"value": float(result["values"])})
+        return
+    central = result["percentiles"][50] if ensemble else result["values"]
+    fig, ax = plt.subplots()
+    if len(ranged) == 1:
+        x = result["axes"][ranged[0]]
+        if ensemble:
+            ax.fill_between(x, result["min"], result["max"], alpha=0.15, label="min–max envelope")
+            ax.fill_between(x, result["percentiles"][5], result["percentiles"][95], alpha=0.35, label="5–95 %")
+            ax.plot(x, result["mean"], linestyle="--", label="mean")
+        ax.plot(x, central, label="median" if ensemble else "value")
+        ax.set_xlabel(ranged[0])
+        ax.set_ylabel("Result")
+        ax.legend()
+    else:
+        x, y = result["axes"][ranged[0]], result["axes"][ranged[1]]
+        mesh = ax.pcolormesh(y, x, central, shading="auto", cmap="viridis")
+        ax.contour(y, x, central, colors="white", linewidths=0.6)
+        fig.colorbar(mesh, ax=ax, label="median" if ensemble else "value")
+        ax.set_xlabel(ranged[1])
+        ax.set_ylabel(ranged[0])
+    ax.set_title("Equation Sweep")
+    st.pyplot(fig)
+    plt.close(fig)
@@ -0,0 +1,201 @@
+# exposure.py — exposure calculator, dose chart, unit converter and radiation types pages
+
+import streamlit as st
+import numpy as np
+
+
+def exposure_calculator():
+    import matplotlib.pyplot as plt
+    from exposure_risk.dose_categories import categorize_dose
+    from exposure_risk.exposure_calc import annual_dose
+
+    st.header("📟 Radiation Exposure Calculator")
+
+    hours = st.slider("Hours exposed per day", min_value=0.0, max_value=24.0, step=0.5, value=2.0)
+    uSv_hour = st.slider("Radiation rate (µSv/hour)", min_value=0.0, max_value=10.0, step=0.1, value=0.5)
+
+    if st.button("Estimate Risk"):
+        from exposure_risk.dose_ledger import compute_ledger
+
+        ledger = compute_ledger({"hours_per_day": [hours], "rate_uSv_per_hour": [uSv_hour]})
+        dose = ledger["annual_dose_mSv"].iloc[0]
+        risk = ledger["cancer_risk"].iloc[0]
+        name, desc, icon, _ = categorize_dose(dose)
+
+        st.success(f"Annual Dose: {dose:,.3f} mSv")
+        st.markdown(f"**Cancer Risk:** {risk:.2%}")
+        st.markdown(f"**Risk Level:** {icon} {name}")
+        st.caption(desc)
+
+        # Create dose chart
+        exposure_range = np.linspace(0, 24, 50)
+        dose_values = annual_dose(exposure_range, uSv_hour)
+
+        fig, ax = plt.subplots()
+        ax.plot(exposure_range, dose_values, color="red", linewidth=2)
+        ax.set_xlabel("Hours per Day")
+        ax.set_ylabel("Annual Dose (mSv)")
+        ax.set_title("Annual Radiation Dose vs. Exposure Time")
+        ax.grid(True)
+
+        st.pyplot(fig)
+
+    with st.expander("👥 Workforce Dose Ledger"):
+        _workforce_ledger()
+
+
+def _workforce_ledger():
+    st.markdown("Upload a CSV or Parquet table with columns `hours_per_day`, `rate_uSv_per_hour` "
+                "and optionally `days` and `worker`.")
+    upload = st.file_uploader("Worker table", type=["csv", "parquet"])
+    if upload is None:
+        return
+
+    import io
+    from exposure_risk.dose_ledger import compute_ledger, read_ledger, summarize_ledger
+    from exposure_risk.exposure_calc import OCCUPATIONAL_LIMIT_mSv, PUBLIC_LIMIT_mSv
+
+    try:
+        ledger = compute_ledger(read_ledger(upload))
+    except ValueError as e:
+        st.error(str(e))
+        return
+
+    summary = summarize_ledger(ledger)
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Workers", f"{summary['workers']:,}")
+    col2.metric(f"Over {PUBLIC_LIMIT_mSv} mSv", f"{summary['over_public_limit']:,}")
+    col3.metric(f"Over {OCCUPATIONAL_LIMIT_mSv} mSv", f"{summary['over_occupational_limit']:,}")
+    st.bar_chart(summary["per_category"])
+    st.dataframe(ledger.nlargest(100, "annual_dose_mSv"))
+
+    buffer = io.BytesIO()
+    ledger.to_parquet(buffer, index=False)
+    st.download_button("Download Results (Parquet)", buffer.getvalue(), file_name="dose_ledger.parquet")
+
+
+def dose_chart():
+    import matplotlib.pyplot as plt
+
+    st.header("📊 Radiation Dose Comparison Chart")
+    st.markdown("""
+This chart helps visualize the scale of different radiation doses — from everyday background exposure to serious nuclear incidents.  
+All doses are in **millisieverts (mSv)** and are based on public safety, medical use, and known accident data.
+""")
+    dose_data = {
+        "Dental X-ray": 0.005,
+        "NY-Tokyo Flight": 0.2,
+        "Chest X-ray": 0.1,
+        "CT Scan": 7,
+        "Annual Background": 2.4,
+        "Nuclear Worker Limit": 50,
+        "Chernobyl Worker": 1000,
+        "Lethal Dose (LD50)": 4000
+    }
+
+    def get_color(dose):
+        if dose <= 0.1:
+            return "green"
+        elif dose <= 10:
+            return "gold"
+        elif dose <= 100:
+            return "orange"
+        elif dose <= 1000:
+            return "red"
+        else:
+            return "darkred"
+
+    labels = list(dose_data.keys())
+    values = list(dose_data.values())
+    colors = [get_color(d) for d in values]
+
+    fig, ax = plt.subplots()
+    ax.barh(labels, values, color=colors)
+    ax.set_xscale("log")
+    ax.set_xlabel("Dose in mSv (log scale)")
+    ax.set_title("Radiation Exposure Levels by Event")
+    ax.grid(True, which="both", linestyle="--", linewidth=0.5)
+
+    st.pyplot(fig)
+
+    st.caption("""
+This chart compares various radiation exposure levels using a logarithmic scale.
+
+- **0.005 mSv** – Dental X-ray  
+- **0.2 mSv** – Flight from New York to Tokyo  
+- **2.4 mSv** – Average annual background radiation  
+- **7 mSv** – CT scan  
+- **50 mSv** – Annual occupational limit (nuclear worker)  
+- **1000 mSv** – Chernobyl emergency worker  
+- **4000 mSv** – Approximate Lethal Dose (LD50)
+
+📌 *Colors indicate severity: Green = Low, Red = High*
+""")
+
+
+def unit_converter():
+    from decay_math.units import convert, dimension
+
+    st.header("🔁 Radiation Unit Converter")
+
+    quantities = {
+        "Dose": ["mSv", "Sv", "μSv", "rem", "mrem", "Gy", "mGy", "rad"],
+        "Dose rate": ["μSv/h", "mSv/h", "Sv/h", "mSv/y", "mrem/h", "μGy/h", "mGy/h", "Gy/h"],
+        "Activity": ["Bq", "kBq", "MBq", "GBq", "TBq", "Ci", "mCi", "μCi"],
+        "Time": ["s", "min", "h", "d", "y"],
+        "Energy": ["eV", "keV", "MeV", "J"],
+    }
+    quantity = st.selectbox("Quantity", list(quantities))
+    units = quantities[quantity]
+    from_unit = st.selectbox("From", units, index=0)
+    to_unit = st.selectbox("To", units, index=1)
+    value = st.number_input("Value to Convert", value=1.0)
+
+    # Gray ↔ sievert needs a radiation weighting factor (1 for photons and electrons)
+    weighting = 1.0
+    if dimension(from_unit).startswith("absorbed") != dimension(to_unit).startswith("absorbed"):
+        weighting = st.number_input("Radiation weighting factor", min_value=0.01, value=1.0)
+
+    if st.button("Convert"):
+        result = convert(value, from_unit, to_unit, weighting)
+        st.success(f"{value} {from_unit} = {result:,.6g} {to_unit}")
+
+
+def radiation_types():
+    st.header("📋 Types of Ionizing Radiation")
+    data = {
+        "Alpha": {
+            "Charge": "+2",
+            "Mass": "Heavy",
+            "Penetration": "Low",
+            "Shielding": "Paper / Skin",
+            "Danger": "High if inhaled"
+        },
+        "Beta": {
+            "Charge": "-1",
+            "Mass": "Light",
+            "Penetration": "Medium",
+            "Shielding": "Aluminum",
+            "Danger": "Can burn skin"
+        },
+        "Gamma": {
+            "Charge": "0",
+            "Mass": "Wave (no mass)",
+            "Penetration": "High",
+            "Shielding": "Lead / Concrete",
+            "Danger": "Deep tissue damage"
+        },
+        "Neutron": {
+            "Charge": "0",
+            "Mass": "Neutral Particle",
+            "Penetration": "Very High",
+            "Shielding": "Water / Borated Concrete",
+            "Danger": "Can activate other materials"
+        }
+    }
+
+    for name, props in data.items():
+        st.subheader(name)
+        for key, val in props.items():
+            st.markdown(f"**{key}:** {val}")
+        st.markdown("---")
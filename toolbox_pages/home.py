@@ -0,0 +1,68 @@
+# home.py — landing page and terms of use
+
+import streamlit as st
+
+
+def home():
+    st.header("📘 Welcome")
+    st.markdown("[📄 View Terms of Use](#📄-terms-of-use)")
+    st.markdown("""
+This is a beginner-level toolkit designed for exploring core topics in nuclear engineering and radiation science:
+
+### 🔬 Key Features:
+- **Radioactive decay** — visualize and calculate half-lives and remaining isotopes.
+- **Decay chain viewer** — follow the U-238, Th-232 and U-235 series and their activities over time.
+- **Radiation exposure and cancer risk** — estimate dose impact and biological effect.
+- **Dose classification** — understand dose categories from safe to hazardous.
+- **Unit conversion** — convert between Sieverts, rem, Gray, and more.
+- **Radiation type reference** — learn properties of alpha, beta, gamma, and neutron radiation.
+- **Isotope Search & Comparison** — search nuclear isotopes and compare their properties.
+- **Shielding Simulation** — model radiation shielding through various materials.
+
+---
+
+### 📌 About
+This application is developed as part of **The Nuclear Toolbox**, a student-led initiative aimed at making nuclear science more accessible.
+
+Built entirely with **Python** and **Streamlit**, this app is optimized for both learners and educators. Future versions aim to support researchers with deeper analysis tools and database integration.
+
+📦 **Version:** 1.1.4 Test
+Feel free to explore, experiment, and contribute to the project!
+""")
+
+
+def terms_of_use():
+    st.subheader("📄 Terms of Use")
+
+    st.markdown("""
+    **Last updated:** June 24, 2025
+
+    By using **The Nuclear Toolbox**, you agree to the following terms:
+
+    ### 1. Purpose
+    This platform is provided for **educational, academic, and non-commercial research use**. It is **not** certified for real-world engineering design or nuclear safety decision-making.
+
+    ### 2. Disclaimer
+    - The app is provided **"as is"** without warranty of any kind.
+    - We do not guarantee the accuracy, completeness, or validity of any simulation result, isotope data, or criticality calculation.
+    - You assume full responsibility for any use of the data or results.
+
+    ### 3. Acceptable Use
+    You agree **not** to:
+    - Use the platform for military, destructive, or harmful applications.
+    - Reverse engineer or redistribute the app without permission.
+    - Submit malicious code, perform exploits, or disrupt service for others.
+
+    ### 4. Data & Privacy
+    - No personal data is collected unless explicitly submitted via feedback forms or login (if applicable).
+    - Anonymous usage data may be collected to improve functionality.
+
+    ### 5. Intellectual Property
+    All original content, graphics, and code are the property of **The Nuclear Toolbox** unless otherwise credited. Licensed under the **MIT License**.
+
+    ### 6. Changes
+    We may update these Terms at any time. Continued use of the app indicates acceptance of the updated Terms.
+
+    ### 7. Contact
+    Contact us at: `thenucleartoolbox@protonmail.com`
+    """)
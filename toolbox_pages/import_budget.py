@@ -0,0 +1,92 @@
+# import_budget.py — measures cold start and first-render time of every page
+#
+# Usage:
+#   python -m toolbox_pages.import_budget            check against import_budget.json
+#   python -m toolbox_pages.import_budget --update   record current timings as the budget
+#
+# Every measurement runs in a fresh interpreter so module caches from earlier
+# pages do not hide the cost of a page's own imports. Pages are rendered in
+# Streamlit bare mode, where widgets return their defaults.
+
+import json
+import os
+import subprocess
+import sys
+
+BUDGET_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "import_budget.json")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COLD_START = "cold start"
+
+# Headroom over a recorded timing before a measurement counts as over budget
+TOLERANCE = 1.5
+
+_probe = """
+import logging, sys, time
+t0 = time.perf_counter()
+import streamlit
+from toolbox_pages import load_page
+cold = time.perf_counter() - t0
+logging.disable(logging.WARNING)
+page = sys.argv[1]
+t1 = time.perf_counter()
+if page:
+    load_page(page)()
+print(cold, time.perf_counter() - t1)
+"""
+
+
+def measure(label="", repeat=3):
+    """
+    Returns (cold_start_s, first_render_s) for a page label, the best of
+    `repeat` fresh interpreters. An empty label measures the cold start only.
+    """
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-c", _probe, label], cwd=ROOT, capture_output=True,
+                                text=True, check=True, env={**os.environ, "PYTHONPATH": ROOT})
+        timing = tuple(float(x) for x in result.stdout.split()[-2:])
+        best = timing if best is None else min(best, timing, key=sum)
+    return best
+
+
+def measure_all(repeat=3):
+    """Returns {COLD_START: seconds, page label: seconds, ...}."""
+    from toolbox_pages import pages
+
+    timings = {COLD_START: measure("", repeat)[0]}
+    for label in pages:
+        timings[label] = measure(label, repeat)[1]
+    return timings
+
+
+def check(timings, budget):
+    """Returns the labels whose timing exceeds TOLERANCE times their budget."""
+    return [label for label, seconds in timings.items()
+            if label in budget and seconds > TOLERANCE * budget[label]]
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    timings = measure_all()
+    for label, seconds in timings.items():
+        print(f"{label:<32} {seconds * 1000:8.1f} ms")
+
+    if "--update" in argv:
+        with open(BUDGET_FILE, "w", encoding="utf-8") as f:
+            json.dump({label: round(seconds, 3) for label, seconds in timings.items()}, f,
+                      indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"Budget written to {BUDGET_FILE}")
+        return 0
+
+    with open(BUDGET_FILE, encoding="utf-8") as f:
+        budget = json.load(f)
+    over = check(timings, budget)
+    for label in over:
+        print(f"Over budget: {label} took {timings[label] * 1000:.1f} ms "
+              f"(budget {budget[label] * 1000:.1f} ms × {TOLERANCE})")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
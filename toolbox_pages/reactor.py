@@ -0,0 +1,229 @@
+# reactor.py — reactor core designer page
+
+import streamlit as st
+import numpy as np
+from reactor_diagram.core_model import build_core, distance_map, enrichment_zones
+from reactor_diagram.diffusion import solve_diffusion
+from reactor_diagram.core_render import LABEL_LIMIT, render_core_png, view_window
+
+GRID_LIMIT = 500
+DIFFUSION_GRID_LIMIT = 300  # cells per side; two LU factorizations keep a solve near one second
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _core_image(model, window):
+    """PNG of the core map, cached per model and zoom window."""
+    return render_core_png(model, window)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _rod_worth(grid_size, base_enrichment, gradient, rods, pitch):
+    """Reactivity of the rod pattern against the rods-out core, cached per design."""
+    from reactor_diagram.point_kinetics import rod_worth
+
+    enrichment = enrichment_zones(distance_map(grid_size), base_enrichment, gradient)
+    return rod_worth(enrichment, rods, pitch)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _deplete(enrichment, rods, pitch, rated_power, step_days, steps):
+    """Burnup history of every cell, re-solving the power map each step; cached per design."""
+    from reactor_diagram.depletion import deplete_core
+
+    previous = {}
+
+    def power_map(fuel):
+        previous["result"] = solve_diffusion(fuel, rods, pitch=pitch, guess=previous.get("result"))
+        return rated_power * previous["result"]["power"]
+
+    return deplete_core(enrichment, power_map(enrichment), pitch, [step_days] * steps, power_update=power_map)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _diffusion(enrichment, rods, pitch, _guess=None):
+    """Diffusion solve cached per design; the warm-start guess is not part of the key."""
+    return solve_diffusion(enrichment, rods, pitch=pitch, guess=_guess)
+
+
+def _solve_core(model, pitch):
+    """Diffusion solve warm-started from the previous rerun's fission source."""
+    result = _diffusion(model["core"].clip(0), model["rods"], pitch, st.session_state.get("diffusion_guess"))
+    st.session_state["diffusion_guess"] = result
+    return result
+
+
+def core_designer():
+    st.subheader("🔧 Advanced Reactor Core Designer")
+
+    st.markdown("""
+    Design a **pressurized water reactor (PWR)** core layout with fuel enrichment zones, control rod placement, and thermal power output.
+    
+    ### 💡 Physics:
+    Each fuel cell contributes power based on enrichment:
+    - **Thermal Power (MWt)** estimated via:  
+      $$ P_{cell} = 10 \\times E \\times k_{eff} $$
+      Where:
+      - $E$ = enrichment (%)
+      - $k_{eff}$ = multiplication factor (default: 1.05)
+    - Total thermal power is the sum of all active fuel cell contributions.
+
+    With **two-group diffusion** enabled, $k_{eff}$ and the power shape are instead
+    solved from fast and thermal diffusion equations on the same grid, with
+    cross-sections derived from each cell's enrichment and rod state.
+
+    **Control Rods** fully suppress power in their cell.
+    """)
+
+    # Inputs
+    use_diffusion   = st.checkbox("Solve k-effective with two-group diffusion", value=True)
+    grid_size       = st.slider("Grid Size (NxN)", 5, DIFFUSION_GRID_LIMIT if use_diffusion else GRID_LIMIT, 15)
+    base_enrichment = st.slider("Base Enrichment (%)", 1.5, 5.0, 3.0, 0.1)
+    gradient        = st.slider("Enrichment Gradient", 0.0, 1.5, 0.4, 0.01)
+    if use_diffusion:
+        core_width  = st.slider("Core Width (cm)", 50, 500, 340, 10)
+        rated_power = st.number_input("Core Thermal Power (MWt)", min_value=1.0, value=3000.0, step=100.0)
+        k_eff       = 1.0
+    else:
+        k_eff       = st.slider("k-effective", 0.8, 1.2, 1.05, 0.01)
+
+    insert_rods     = st.checkbox("Insert Control Rods")
+    rod_spacing     = st.slider("Rod Spacing", 2, max(6, grid_size // 10), 3) if insert_rods else None
+
+    # Reactor Grid Setup
+    model       = build_core(grid_size, base_enrichment, gradient, k_eff, rod_spacing)
+    core        = model["core"]
+
+    if use_diffusion:
+        result = _solve_core(model, core_width / grid_size)
+        k_eff = round(result["k_eff"], 4)
+        model["power"] = rated_power * result["power"]
+        model["total_power"] = rated_power
+        st.caption(f"Diffusion solve: {grid_size}×{grid_size} cells of {core_width / grid_size:.2f} cm, "
+                   f"{result['iterations']} source iterations")
+    total_power = model["total_power"]
+
+    # Zoom window; labels appear once it is small enough to read them
+    window = None
+    if grid_size > LABEL_LIMIT and st.checkbox("Zoom in"):
+        size = st.slider("Window Size (cells)", 5, grid_size, min(grid_size, LABEL_LIMIT))
+        row = st.slider("Window Center Row", 0, grid_size - 1, grid_size // 2)
+        col = st.slider("Window Center Column", 0, grid_size - 1, grid_size // 2)
+        window = view_window(grid_size, (row, col), size)
+
+    # Plotting
+    st.image(_core_image(model, window))
+
+    # Cell inspector
+    with st.expander("🔎 Inspect Cell"):
+        c1, c2 = st.columns(2)
+        i = c1.number_input("Row", 0, grid_size - 1, grid_size // 2)
+        j = c2.number_input("Column", 0, grid_size - 1, grid_size // 2)
+        if model["rods"][i, j]:
+            st.write(f"Cell ({i}, {j}): control rod, 0 MWt")
+        else:
+            st.write(f"Cell ({i}, {j}): {core[i, j]:.2f}% enrichment, {model['power'][i, j]:.2f} MWt")
+
+    if use_diffusion and insert_rods:
+        with st.expander("⏱️ Rod Transient (Point Kinetics)"):
+            _rod_transient(grid_size, base_enrichment, gradient, model["rods"], core_width / grid_size)
+
+    if use_diffusion:
+        with st.expander("♻️ Fuel Depletion"):
+            _fuel_depletion(model, core_width / grid_size, rated_power)
+
+    # Summary
+    st.markdown(f"""
+    ## 🔋 Reactor Summary
+    - 🔥 Estimated Total Thermal Power: `{total_power:.2f} MWt`
+    - 🧪 Average Fuel Enrichment: `{model["mean_enrichment"]:.2f}%`
+    - ☢️ k-effective: `{k_eff}`
+    """)
+
+
+def _rod_transient(grid_size, base_enrichment, gradient, rods, pitch):
+    import time
+    from matplotlib.figure import Figure
+    from reactor_diagram.point_kinetics import keepin_groups, ramp_insertion, simulate_transient
+
+    beta = keepin_groups["beta"].sum()
+    worth = _rod_worth(grid_size, base_enrichment, gradient, rods, pitch)
+    st.markdown(f"Rod bank worth: `{worth * 1e5:,.0f} pcm` (`{worth / beta:,.2f} $`), from two diffusion "
+                "solves with and without the rods. The transient starts critical at nominal power; "
+                "there is no temperature feedback.")
+    col1, col2 = st.columns(2)
+    motion = col1.radio("Rod Motion", ["Insert", "Withdraw"], horizontal=True)
+    fraction = col2.slider("Bank Worth Moved (%)", 0.1, 100.0, 1.0, 0.1)
+    durations = col1.multiselect("Insertion Time (s)", [0, 1, 10, 60], default=[0, 10],
+                                 format_func=lambda d: "step" if d == 0 else f"{d} s ramp")
+    t_end = col2.select_slider("Simulated Time (s)", [10, 60, 600, 3600], value=60)
+    rho = worth * fraction / 100 * (1 if motion == "Insert" else -1)
+    if rho >= beta:
+        st.warning(f"ρ = {rho / beta:.2f} $ is prompt supercritical: power rises without bound.")
+    if not durations:
+        return
+
+    start = time.perf_counter()
+    result = simulate_transient([ramp_insertion(rho, d, start=1.0) for d in durations], t_end)
+    elapsed = time.perf_counter() - start
+    st.caption(f"{len(durations)} scenarios × {result['time'].size:,} points at 1 ms in {elapsed:.2f} s "
+               f"({result['steps']} integrator steps)")
+
+    stride = max(1, result["time"].size // 4000)
+    fig = Figure(figsize=(8, 4))
+    ax = fig.subplots()
+    for d, power in zip(durations, result["power"]):
+        ax.plot(result["time"][::stride], power[::stride], label="step" if d == 0 else f"{d} s ramp")
+    ax.set_yscale("log")
+    ax.set_xlabel("Time (s)")
+    ax.set_ylabel("Relative Power")
+    ax.set_title(f"{motion} {abs(rho) * 1e5:,.0f} pcm ({abs(rho) / beta:.2f} $) at t = 1 s")
+    ax.grid(True, which="both", alpha=0.3)
+    ax.legend()
+    st.pyplot(fig)
+
+
+def _fuel_depletion(model, pitch, rated_power):
+    from reactor_diagram.depletion import CORE_HEIGHT_CM, nuclides
+
+    st.markdown(f"Depletes every fuel cell at its share of the power map, with a {CORE_HEIGHT_CM:.0f} cm active "
+                "height and one-group cross-sections. Each step advances the burnup matrix of all cells at once "
+                "with a Chebyshev rational approximation, then re-solves the power map from the burnt fuel.")
+    col1, col2 = st.columns(2)
+    step_days = col1.select_slider("Step Length (days)", [1, 5, 10, 30, 60, 90], value=30)
+    steps = col2.slider("Burnup Steps", 1, 60, 24)
+    if not st.button("Deplete Core"):
+        return
+    import time
+    from matplotlib.figure import Figure
+
+    start = time.perf_counter()
+    with st.spinner("Depleting fuel..."):
+        history = _deplete(model["core"].clip(0), model["rods"], pitch, rated_power, step_days, steps)
+    elapsed = time.perf_counter() - start
+    burnup = history["burnup_MWd_per_kg"]
+    fuel = burnup[-1] > 0
+    if not fuel.any():
+        st.info("No cell produces power; nothing to deplete.")
+        return
+    st.caption(f"{fuel.sum():,} fuel cells × {steps} steps in {elapsed:.2f} s")
+
+    fig = Figure(figsize=(10, 4))
+    ax_inventory, ax_map = fig.subplots(1, 2)
+    mean_burnup = burnup[:, fuel].mean(axis=1)
+    for name in ("U-235", "Pu-239", "Pu-241"):
+        ax_inventory.plot(mean_burnup, history["inventory"][:, fuel, nuclides.index(name)].mean(axis=1),
+                          marker=".", label=name)
+    ax_inventory.set_xlabel("Core-Average Burnup (MWd/kgHM)")
+    ax_inventory.set_ylabel("Atom Density (atoms/cm³)")
+    ax_inventory.set_title(f"After {history['time_days'][-1]:,.0f} days")
+    ax_inventory.grid(True, alpha=0.3)
+    ax_inventory.legend()
+    image = ax_map.imshow(np.where(fuel, burnup[-1], np.nan), cmap="inferno")
+    fig.colorbar(image, ax=ax_map, label="Burnup (MWd/kgHM)")
+    ax_map.set_title("Discharge Burnup")
+    ax_map.set_xticks([])
+    ax_map.set_yticks([])
+    st.pyplot(fig)
+
+    st.write(f"Peak cell burnup: `{burnup[-1].max():.1f} MWd/kgHM` "
+             f"(core average `{mean_burnup[-1]:.1f}`)")
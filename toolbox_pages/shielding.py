@@ -0,0 +1,149 @@
+# shielding.py — shielding simulation page
+
+import streamlit as st
+from graph_export.diagram_cache import show_diagram
+from shielding.shielding_simulator import calculate_shielded_dose, shielding_factors
+
+
+def shielding_simulation():
+    import graphviz
+    import numpy as np
+    from shielding.attenuation import energy_grid, transmission
+
+    st.title("🛡️ Shielding Simulator")
+    st.markdown("Estimate how much radiation passes through different shielding materials.")
+
+    dose_input = st.number_input("Initial Radiation Dose (μSv)", min_value=0.0, step=0.1)
+    material_choice = st.selectbox("Shielding Material", list(shielding_factors.keys()))
+
+    use_thickness = st.checkbox("Model thickness and photon energy", value=True)
+    layers = []
+    energy = 1.0
+    if use_thickness:
+        col1, col2 = st.columns(2)
+        thickness = col1.number_input("Thickness (cm)", min_value=0.0, value=5.0, step=0.5)
+        energy = col2.number_input("Photon Energy (MeV)", min_value=float(energy_grid[0]),
+                                   max_value=float(energy_grid[-1]), value=0.662, step=0.1)
+        with st.expander("➕ Backing layer"):
+            backing = st.selectbox("Backing Material", ["None"] + list(shielding_factors.keys()))
+            backing_thickness = st.number_input("Backing Thickness (cm)", min_value=0.0, value=1.0, step=0.5)
+        layers = [(material_choice, thickness)]
+        if backing != "None":
+            layers.append((backing, backing_thickness))
+        buildup = st.checkbox("Include scatter buildup", value=True)
+
+    if st.button("Calculate"):
+        if use_thickness:
+            transmitted = float(transmission(layers, energy, buildup))
+            remaining, blocked = dose_input * transmitted, 1 - transmitted
+        else:
+            remaining, blocked = calculate_shielded_dose(dose_input, material_choice)
+
+        st.success(f"🛑 Blocked: {blocked * 100:.1f}%")
+        st.info(f"☢️ Remaining Dose: {remaining:,.2f} μSv")
+
+        st.bar_chart({
+            "Dose (μSv)": {
+                "Initial": dose_input,
+                "Remaining": remaining
+            }
+        })
+
+        if use_thickness:
+            # Whole curve in one vectorized call, sweeping the first layer
+            st.markdown("### 📈 Dose vs. Thickness")
+            sweep = np.linspace(0, max(2 * layers[0][1], 1.0), 200)
+            curve = dose_input * transmission([(material_choice, sweep)] + layers[1:], energy, buildup)
+            st.line_chart({"Thickness (cm)": sweep, "Remaining Dose (μSv)": curve},
+                          x="Thickness (cm)", y="Remaining Dose (μSv)")
+
+        # 📊 Graphviz visual
+        st.markdown("### 📉 Shielding Path")
+        g = graphviz.Digraph()
+
+        g.node("A", f"{dose_input:.2f} μSv", shape="circle", color="orange", style="filled")
+        g.node("B", " + ".join(name for name, _ in layers) or material_choice, shape="box", color="lightblue",
+               style="filled")
+        g.node("C", f"{remaining:,.2f} μSv", shape="circle", color="green", style="filled")
+
+        g.edge("A", "B", label="Shielding")
+        g.edge("B", "C", label="Transmitted")
+
+        show_diagram(g)
+
+    with st.expander("🧮 Optimize Shield Stack"):
+        _shield_optimizer(dose_input)
+
+    with st.expander("🗺️ Dose-Rate Map"):
+        _dose_map()
+
+
+def _shield_optimizer(dose_input):
+    import os
+    from shielding.attenuation import energy_grid
+    from shielding.shield_optimizer import objective_units, optimize_shield
+
+    st.markdown("Search stacks of materials for the thinnest, lightest or cheapest shield that meets a dose target.")
+    col1, col2 = st.columns(2)
+    target = col1.number_input("Target Dose (μSv)", min_value=0.001, value=max(dose_input / 1000, 0.001),
+                               format="%.3f")
+    energy = col2.number_input("Photon Energy (MeV) ", min_value=float(energy_grid[0]),
+                               max_value=float(energy_grid[-1]), value=1.25, step=0.1)
+    objective = col1.selectbox("Minimize", list(objective_units))
+    max_layers = col2.slider("Maximum Layers", 1, 4, 3)
+    chosen = st.multiselect("Materials", list(shielding_factors), default=[m for m in shielding_factors if m != "Air"])
+
+    if st.button("Optimize"):
+        if not dose_input or not chosen:
+            st.warning("Enter an initial dose and pick at least one material.")
+            return
+        try:
+            with st.spinner("Searching stacks..."):
+                result = optimize_shield(dose_input, target, energy, objective, chosen, max_layers,
+                                         workers=os.cpu_count())
+        except ValueError as e:
+            st.error(str(e))
+            return
+        st.success(f"Best stack: {result['objective']:,.2f} {objective_units[objective]}, "
+                   f"transmitting {dose_input * result['transmission']:,.3f} μSv")
+        st.table({"Layer": [name for name, _ in result["layers"]],
+                  "Thickness (cm)": [t for _, t in result["layers"]]})
+        st.caption(f"{result['stacks']:,} stack orders, {result['pruned']:,} pruned by the bound, "
+                   f"{result['evaluated']:,} partial stacks scored.")
+
+
+def _dose_map():
+    from shielding.dose_field import gamma_lines
+
+    st.markdown("Dose rate around a point source with a shield wall, in the horizontal plane through the source.")
+    col1, col2 = st.columns(2)
+    isotope = col1.selectbox("Source Isotope", list(gamma_lines))
+    activity = col2.number_input("Activity (MBq)", min_value=0.001, value=1000.0)
+    wall_material = col1.selectbox("Wall Material", list(shielding_factors),
+                                   index=list(shielding_factors).index("Concrete"))
+    wall_thickness = col2.number_input("Wall Thickness (cm)", min_value=0.0, value=30.0, step=5.0)
+    wall_distance = col1.number_input("Source to Wall (cm)", min_value=1.0, value=100.0, step=10.0)
+    extent = col2.number_input("Map Half-Width (cm)", min_value=50.0, value=400.0, step=50.0)
+
+    if st.button("Draw Map"):
+        import numpy as np
+        from matplotlib.colors import LogNorm
+        from matplotlib.figure import Figure
+        from decay_math.units import convert
+        from shielding.dose_field import dose_field, point_source, slab
+
+        axis = np.linspace(-extent, extent, 301)
+        shields = [slab(wall_material, 0, wall_distance, wall_distance + wall_thickness)] if wall_thickness else []
+        source = point_source(isotope, convert(activity, "MBq", "Bq"), (0, 0, 0))
+        field = dose_field([source], shields, axis, axis, [0.0])[:, :, 0]
+
+        fig = Figure(figsize=(7, 6))
+        ax = fig.subplots()
+        im = ax.imshow(field.T, origin="lower", extent=(-extent, extent, -extent, extent), cmap="inferno",
+                       norm=LogNorm(vmin=max(field.min(), field.max() * 1e-8), vmax=field.max()))
+        if shields:
+            ax.axvspan(wall_distance, wall_distance + wall_thickness, color="white", alpha=0.3)
+        fig.colorbar(im, ax=ax, label="H*(10) rate (μSv/h)")
+        ax.set_xlabel("x (cm)")
+        ax.set_ylabel("y (cm)")
+        st.pyplot(fig)
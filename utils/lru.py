@@ -0,0 +1,56 @@
+# lru.py — thread-safe bounded LRU cache shared across Streamlit sessions
+
+import threading
+from collections import OrderedDict
+
+CACHE_SIZE = 128
+
+
+class LRUCache:
+    """
+    Bounded least-recently-used cache with hit, miss and eviction counters.
+    Instances live at module level (compiled equations, sweep grids,
+    diagram SVGs), so every Streamlit session in the process shares them;
+    a lock keeps concurrent sessions consistent.
+    """
+
+    def __init__(self, maxsize=CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, build):
+        """Returns the entry for key, calling build() and storing the result on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        # Build outside the lock; if two sessions race, the first stored entry wins
+        entry = build()
+        with self._lock:
+            entry = self._entries.setdefault(key, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "size": len(self._entries), "maxsize": self.maxsize,
+                    "hit_rate": self.hits / lookups if lookups else 0.0}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)